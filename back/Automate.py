@@ -1,8 +1,47 @@
 from abc import ABC, abstractmethod
+from array import array
 from typing import Set, Dict, List, Tuple, Optional, Union, Any
 from Etat import Etat
 from Mot import Mot
 from Langage import Langage
+from Trie import Trie
+from TableTransitions import TableTransitions
+from MatriceCreuse import TransitionsCSR
+from MatriceBooleenne import MatriceBooleenne, fermeture_produits
+from ReconnaisseurFlux import ReconnaisseurFlux
+from CacheDeterminisation import CacheDeterminisation
+from IndexGraphe import IndexGraphe, composantes_fortement_connexes
+from Monoids import Monoids
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : repli sur la table compilée
+    np = None
+
+
+# Symbole des transitions spontanées (ε)
+EPSILON = ""
+
+# Échappement (par \\) des caractères structurants dans les noms composés des
+# états produits et des sous-ensembles : deux n-uplets (ou ensembles)
+# distincts d'états reçoivent toujours des noms distincts
+_ECHAPPEMENT_PRODUIT = str.maketrans({c: "\\" + c for c in "\\,()⊥"})
+_ECHAPPEMENT_ENSEMBLE = str.maketrans({c: "\\" + c for c in "\\,{}∅"})
+
+
+def _indices_masque(masque: int) -> List[int]:
+    """
+    Décompose un ensemble d'états codé en masque de bits en liste d'indices
+    croissants, en temps linéaire : l'écriture binaire (inversée) est
+    parcourue une fois, les zéros étant sautés par str.find.
+    """
+    bits = bin(masque)[:1:-1]
+    indices = []
+    i = bits.find("1")
+    while i >= 0:
+        indices.append(i)
+        i = bits.find("1", i + 1)
+    return indices
 
 
 class Automate(ABC):
@@ -31,9 +70,16 @@ class Automate(ABC):
         """
         self.alphabet = set(alphabet) if alphabet is not None else set()
         self.transitions = {}
+        self._table = None
+        self._graphe = None
+        self._matrices = None
+        self._lettres = None
 
         if etats is not None:
-            self.etats = etats  
+            # Copie : l'automate peut ajouter des états (puits) sans modifier l'ensemble de l'appelant
+            self.etats = set(etats)
+            for etat in self.etats:
+                etat.rattacher(self)
         else :
             raise ValueError("Un automate doit avoir des etats")
         
@@ -43,12 +89,83 @@ class Automate(ABC):
         else :
             raise ValueError("L'état initial doit être défini et appartenir aux états")
         
-        if etats_finaux is not None and etats_finaux & self.etats :
+        # Un ensemble vide est accepté : c'est le cas des automates du langage vide
+        if etats_finaux is not None and (not etats_finaux or etats_finaux & self.etats):
             self.etats_finaux = etats_finaux  
             for etat in self.etats_finaux:
                 etat.est_final = True
         else :
             raise ValueError("Un automate doit avoir des états finaux")
+
+    def _invalider_caches(self) -> None:
+        """Oublie les structures dérivées des transitions (table compilée, ...)."""
+        self._table = None
+        self._graphe = None
+        self._matrices = None
+        self._lettres = None
+
+    def index_graphe(self) -> IndexGraphe:
+        """
+        Index du graphe de l'automate (adjacences, arbres de parcours,
+        composantes fortement connexes), partagé par les requêtes des états
+        et conservé jusqu'à la prochaine modification.
+        """
+        if self._graphe is None:
+            self._graphe = IndexGraphe(self)
+        return self._graphe
+
+    def _ordre_etats(self) -> List[Etat]:
+        """Ordre canonique des états : l'état initial, puis les autres triés par nom."""
+        autres = sorted((etat for etat in self.etats if etat != self.etat_initial), key=str)
+        return [self.etat_initial] + autres
+
+    def compiler(self) -> TableTransitions:
+        """
+        Fige l'automate (déterministe) en une table de transitions indexée
+        par entiers. La table est conservée jusqu'à la prochaine modification.
+        """
+        if self._table is None:
+            self._table = TableTransitions(self._ordre_etats(), self.alphabet,
+                                           self.transitions, self.etats_finaux)
+        return self._table
+        
+    def _table_masques(self) -> Tuple[List[Etat], List[str], int, List[List[int]], int]:
+        """
+        Représentation des transitions par masques de bits sur les indices
+        des états (ordre de _ordre_etats).
+
+        Returns:
+            (etats, symboles, masque_initial, successeurs, masque_final) où
+            successeurs[j][i] est le masque des états atteints depuis l'état i
+            avec le symbole j
+        """
+        etats = self._ordre_etats()
+        index = {etat: i for i, etat in enumerate(etats)}
+        symboles = set(self.alphabet)
+        for sorties in self.transitions.values():
+            symboles.update(sorties.keys())
+        symboles.discard(EPSILON)
+        symboles = sorted(symboles)
+        indices_symboles = {symbole: j for j, symbole in enumerate(symboles)}
+
+        successeurs = [[0] * len(etats) for _ in symboles]
+        for source, sorties in self.transitions.items():
+            i = index[source]
+            for symbole, destinations in sorties.items():
+                j = indices_symboles.get(symbole)
+                if j is None:
+                    continue
+                masque = 0
+                for destination in destinations:
+                    masque |= 1 << index[destination]
+                successeurs[j][i] = masque
+
+        masque_final = 0
+        for etat in self.etats_finaux:
+            if etat in index:
+                masque_final |= 1 << index[etat]
+
+        return etats, symboles, 1, successeurs, masque_final
         
     def ajouter_transition(self, source: Etat, symbole: str, destination: Etat):
         """Ajoute une transition à l'automate."""
@@ -57,30 +174,155 @@ class Automate(ABC):
         if symbole not in self.transitions[source]:
             self.transitions[source][symbole] = set()
         self.transitions[source][symbole].add(destination)
+        self._invalider_caches()
 
-    def matrice_a_automate(self, matrice: list[list]):
-        pass
+    def automate_a_csr(self) -> TransitionsCSR:
+        """
+        Transitions au format creux CSR (ordre canonique des états, symboles
+        triés), en temps linéaire.
+        """
+        return TransitionsCSR.depuis_transitions(self._ordre_etats(), self.alphabet,
+                                                 self.transitions)
+
+    def matrice_a_automate(self, matrice: Union[TransitionsCSR, List[List[Set[int]]]],
+                           etats_list: Optional[List[Etat]] = None,
+                           alphabet_list: Optional[List[str]] = None) -> None:
+        """
+        Remplace les transitions de l'automate par celles d'une matrice, en
+        temps linéaire.
+
+        Args:
+            matrice: Stockage CSR, ou matrice n×m d'ensembles d'indices
+                (le format de automate_a_matrice)
+            etats_list: États des lignes ; par défaut ceux du stockage CSR,
+                ou l'ordre canonique de l'automate
+            alphabet_list: Symboles des colonnes ; par défaut ceux du stockage
+                CSR, ou l'alphabet trié de l'automate, précédé de ε pour un
+                AFNS dont la matrice a une colonne de plus (l'ordre de
+                automate_a_matrice, où ε = "" est le plus petit symbole)
+        """
+        if not isinstance(matrice, TransitionsCSR):
+            if etats_list is None:
+                etats_list = self._ordre_etats()
+            if alphabet_list is None:
+                alphabet_list = sorted(self.alphabet - {EPSILON})
+                if isinstance(self, AFNS) and matrice and len(matrice[0]) == len(alphabet_list) + 1:
+                    alphabet_list = [EPSILON] + alphabet_list
+            matrice = TransitionsCSR.depuis_listes(matrice, etats_list, alphabet_list)
+        elif etats_list is not None or alphabet_list is not None:
+            matrice = TransitionsCSR(etats_list if etats_list is not None else matrice.etats,
+                                     alphabet_list if alphabet_list is not None else matrice.symboles,
+                                     matrice.debuts, matrice.cibles)
+
+        inconnus = [etat for etat in matrice.etats if etat not in self.etats]
+        if inconnus:
+            raise ValueError(f"États étrangers à l'automate : {inconnus}")
+
+        anciennes = self.transitions
+        self.transitions = {}
+        etats = matrice.etats
+        symboles = matrice.symboles
+        try:
+            for i, j, k in matrice.aretes():
+                self.ajouter_transition(etats[i], symboles[j], etats[k])
+        except ValueError:
+            self.transitions = anciennes
+            raise
+        finally:
+            self._invalider_caches()
+
+    def automate_a_matrice(self) -> Tuple[List[List[Set[int]]], List[Etat], List[str]]:
+        """
+        Conversion temporaire pour algorithmes matriciels : matrice n×m
+        d'ensembles d'indices d'états, construite en temps linéaire depuis
+        le stockage CSR.
+        """
+        csr = self.automate_a_csr()
+        return csr.vers_listes(), csr.etats, csr.symboles
+
+    def matrices_booleennes(self) -> Dict[str, MatriceBooleenne]:
+        """
+        Relation de transition de chaque symbole (ε compris) en matrice
+        booléenne compacte, sur l'ordre canonique des états. Conservées
+        jusqu'à la prochaine modification.
+        """
+        if self._matrices is None:
+            csr = self.automate_a_csr()
+            self._matrices = {symbole: MatriceBooleenne.depuis_csr(csr, j)
+                              for j, symbole in enumerate(csr.symboles)}
+        return self._matrices
+
+    def _matrices_lettres(self) -> Tuple[int, Dict[str, MatriceBooleenne], int]:
+        """
+        Vecteur initial, matrices des lettres et vecteur final, les
+        ε-transitions étant absorbées (M'(a) = M(a)·E*, vecteur initial
+        ε-fermé). Conservés jusqu'à la prochaine modification.
+        """
+        if self._lettres is not None:
+            return self._lettres
+
+        matrices = self.matrices_booleennes()
+        etats = self._ordre_etats()
+        finaux = 0
+        for i, etat in enumerate(etats):
+            if etat in self.etats_finaux:
+                finaux |= 1 << i
+
+        epsilon = matrices.get(EPSILON)
+        if epsilon is None or epsilon.est_nulle():
+            lettres = {symbole: matrice for symbole, matrice in matrices.items() if symbole != EPSILON}
+            self._lettres = (1, lettres, finaux)
+            return self._lettres
+        if isinstance(self, AFNS):
+            # E* se lit sur l'index des ε-fermetures (condensation en composantes
+            # fortement connexes, même ordre d'états que les matrices)
+            fermeture = MatriceBooleenne(len(etats), self._index_fermetures()[2])
+        else:
+            fermeture = epsilon.fermeture_transitive(reflexive=True)
+        lettres = {symbole: matrice * fermeture
+                   for symbole, matrice in matrices.items() if symbole != EPSILON}
+        self._lettres = (fermeture.lignes[0], lettres, finaux)
+        return self._lettres
+
+    def reconnaitre_mot_matriciel(self, mot) -> bool:
+        """
+        Reconnaissance par produits vecteur-matrice successifs : l'ensemble
+        des états courants est un vecteur booléen (un entier).
+        """
+        vecteur, lettres, finaux = self._matrices_lettres()
+        for symbole in mot:
+            matrice = lettres.get(symbole)
+            if matrice is None:
+                return False
+            vecteur = matrice.produit_vecteur(vecteur)
+            if not vecteur:
+                return False
+        return bool(vecteur & finaux)
+
+    def matrice_accessibilite(self) -> MatriceBooleenne:
+        """
+        Fermeture réflexive et transitive du graphe de l'automate : la
+        case (i, k) vaut 1 si l'état k est atteignable depuis l'état i
+        (ordre canonique des états).
+        """
+        matrices = list(self.matrices_booleennes().values())
+        if not matrices:
+            return MatriceBooleenne.identite(len(self.etats))
+        union = matrices[0]
+        for matrice in matrices[1:]:
+            union = union | matrice
+        return union.fermeture_transitive(reflexive=True)
+
+    def matrices_monoide(self, max_elements: Optional[int] = None) -> List[MatriceBooleenne]:
+        """
+        Monoïde des transitions en matrices booléennes : clôture par produit
+        des matrices des lettres (ε absorbées), l'identité (mot vide) en premier.
+        """
+        _, lettres, _ = self._matrices_lettres()
+        if not lettres:
+            return [MatriceBooleenne.identite(len(self.etats))]
+        return fermeture_produits([lettres[symbole] for symbole in sorted(lettres)], max_elements)
 
-    def automate_a_matrice(self):
-        """Conversion temporaire pour algorithmes matriciels"""
-        etats_list = list(self.etats)
-        alphabet_list = list(self.alphabet)
-        n = len(etats_list)
-        m = len(alphabet_list)
-        
-        matrice = [[set() for _ in range(m)] for _ in range(n)]
-        
-        for i, etat in enumerate(etats_list):
-            if etat in self.transitions:
-                for j, symbole in enumerate(alphabet_list):
-                    if symbole in self.transitions[etat]:
-                        for dest in self.transitions[etat][symbole]:
-                            k = etats_list.index(dest)
-                            matrice[i][j].add(k)
-        
-        return matrice, etats_list, alphabet_list
-    
-    
     def supprimer_transition(self, etat_source: str, symbole: str, etat_cible: str) -> None:
         """Supprime une transition de l'automate."""
         if (etat_source in self.transitions and 
@@ -94,6 +336,7 @@ class Automate(ABC):
                 del self.transitions[etat_source][symbole]
             if not self.transitions[etat_source]:
                 del self.transitions[etat_source]
+            self._invalider_caches()
         else:
             raise IndexError("etat_source, etat_cible ou transisions inconnu")
     
@@ -105,13 +348,56 @@ class Automate(ABC):
     
     def reconnaitre_mot(self, mot: str) -> bool:
         """Détermine si un mot est reconnu par l'automate."""
+        return self._reconnaitre_iteratif(mot)
+
+    def reconnaitre_mot_recursif(self, mot: str) -> bool:
+        """Ancien moteur récursif, conservé pour vérifier le moteur itératif."""
         return self._reconnaitre_recursif(mot, self.etat_initial)
 
+    def _reconnaitre_iteratif(self, mot: str, arret_anticipe: bool = True) -> bool:
+        """
+        Simulation par ensemble d'états : la frontière avance d'un symbole à
+        la fois, sans récursion ni découpage du mot (temps linéaire en |mot|).
+
+        Args:
+            mot: Mot à reconnaître (str, Mot ou tout itérable de symboles)
+            arret_anticipe: Arrête la lecture dès que la frontière est vide
+        """
+        frontiere = self._avancer_frontiere(self._frontiere_initiale(), mot, arret_anticipe)
+        return not frontiere.isdisjoint(self.etats_finaux)
+
+    def _frontiere_initiale(self) -> Set[Etat]:
+        """Ensemble d'états actifs avant la lecture du premier symbole."""
+        return {self.etat_initial}
+
+    def _fermeture(self, ensemble: Set[Etat]) -> Set[Etat]:
+        """Complète un ensemble d'états par les transitions spontanées (aucune ici)."""
+        return ensemble
+
+    def _avancer_frontiere(self, frontiere: Set[Etat], symboles,
+                           arret_anticipe: bool = True) -> Set[Etat]:
+        """Fait avancer un ensemble d'états actifs sur une suite de symboles."""
+        transitions = self.transitions
+
+        for symbole in symboles:
+            suivants = set()
+            for etat in frontiere:
+                sorties = transitions.get(etat)
+                if sorties is not None:
+                    destinations = sorties.get(symbole)
+                    if destinations:
+                        suivants |= destinations
+            frontiere = suivants
+            if not frontiere and arret_anticipe:
+                break
+
+        return frontiere
+
     def _reconnaitre_recursif(self, mot: str, etat_courant: Etat):
         """Fonction récursive pour la reconnaissance de mots."""
 
         if not mot:
-            return etat_courant.est_final
+            return etat_courant in self.etats_finaux
     
         symbole = mot[0]
         reste_du_mot = mot[1:]
@@ -124,6 +410,283 @@ class Automate(ABC):
                 
         return False
     
+    def reconnaisseur(self, encodage: str = "utf-8") -> ReconnaisseurFlux:
+        """Retourne un reconnaisseur incrémental (feed / accepte / reset) sur l'automate."""
+        return ReconnaisseurFlux(self, encodage)
+
+    def reconnaitre_flux(self, flux, taille_bloc: int = 1 << 16,
+                         encodage: str = "utf-8") -> bool:
+        """
+        Reconnaît un mot lu par blocs depuis un flux (fichier, socket.makefile,
+        mmap, ...) sans jamais le charger entièrement en mémoire.
+        """
+        reconnaisseur = self.reconnaisseur(encodage)
+        while True:
+            bloc = flux.read(taille_bloc)
+            if not bloc:
+                break
+            reconnaisseur.feed(bloc)
+            if reconnaisseur.est_bloque():
+                break
+        return reconnaisseur.accepte()
+
+    def reconnaitre_lot(self, mots) -> Union[List[bool], Any]:
+        """
+        Reconnaît un lot de mots et retourne les résultats dans l'ordre d'entrée.
+
+        Pour un automate déterministe, avec NumPy, les mots sont regroupés par
+        longueur et avancent tous ensemble, une colonne à la fois, par
+        indexation vectorisée de la table compilée.
+        Retourne un tableau NumPy de booléens si NumPy est disponible, sinon
+        une liste de booléens.
+        """
+        mots = [mot.contenu if isinstance(mot, Mot) else mot for mot in mots]
+
+        if not self.est_deterministe():
+            resultats = [self.reconnaitre_mot(mot) for mot in mots]
+            return np.array(resultats, dtype=bool) if np is not None else resultats
+
+        table = self.compiler()
+        if np is None or not all(len(symbole) == 1 for symbole in table.symboles) \
+                or not all(isinstance(mot, str) for mot in mots):
+            resultats = [table.reconnaitre(mot) for mot in mots]
+            return np.array(resultats, dtype=bool) if np is not None else resultats
+
+        return self._reconnaitre_lot_vectorise(mots, table)
+
+    def _reconnaitre_lot_vectorise(self, mots: List[str], table: TableTransitions):
+        """Avance simultanément, colonne par colonne, les mots de même longueur."""
+        n, m = table.nb_etats, table.nb_symboles
+
+        # Table étendue : l'état n est un puits, le symbole m représente
+        # tout caractère hors de l'alphabet
+        etendue = np.full((n + 1, m + 1), n, dtype=np.int32)
+        base = np.array(table.table, dtype=np.int32).reshape(n, m)
+        etendue[:n, :m] = np.where(base < 0, n, base)
+        finaux = np.zeros(n + 1, dtype=bool)
+        finaux[:n] = np.frombuffer(bytes(table.finaux), dtype=np.uint8).astype(bool)
+
+        # Code Unicode -> indice de symbole
+        codes = [ord(symbole) for symbole in table.symboles]
+        conversion = np.full(max(codes, default=0) + 2, m, dtype=np.int32)
+        conversion[codes] = np.arange(m, dtype=np.int32)
+
+        # Tous les mots sont convertis en une seule passe, puis regroupés par
+        # longueur à partir de leurs positions dans le texte concaténé
+        longueurs = np.fromiter(map(len, mots), dtype=np.int64, count=len(mots))
+        debuts = np.zeros(len(mots), dtype=np.int64)
+        np.cumsum(longueurs[:-1], out=debuts[1:])
+        texte = "".join(mots).encode("utf-32-le")
+        points = np.frombuffer(texte, dtype=np.uint32)
+        symboles = conversion[np.minimum(points, len(conversion) - 1)]
+
+        resultats = np.zeros(len(mots), dtype=bool)
+        for longueur in np.unique(longueurs):
+            indices = np.flatnonzero(longueurs == longueur)
+            etats = np.zeros(len(indices), dtype=np.int32)
+            positions = debuts[indices]
+            for colonne in range(longueur):
+                etats = etendue[etats, symboles[positions + colonne]]
+            resultats[indices] = finaux[etats]
+
+        return resultats
+    
+    def _vue_sous_ensembles(self, autre: 'Automate') -> Tuple[List[str], List[tuple]]:
+        """
+        Vues « sous-ensembles » (masques de bits) des deux automates sur
+        l'union de leurs symboles.
+
+        Returns:
+            (symboles, [(masque_initial, successeurs[j][i], masque_final) par automate])
+        """
+        tables = [automate._table_masques() for automate in (self, autre)]
+        symboles = sorted(set(tables[0][1]) | set(tables[1][1]))
+        vues = []
+        for etats, symboles_locaux, initial, successeurs, masque_final in tables:
+            colonnes = {symbole: j for j, symbole in enumerate(symboles_locaux)}
+            vide = [0] * len(etats)
+            vues.append((initial,
+                         [successeurs[colonnes[symbole]] if symbole in colonnes else vide
+                          for symbole in symboles],
+                         masque_final))
+        return symboles, vues
+
+    @staticmethod
+    def _avancer_masque(masque: int, successeurs_symbole: List[int]) -> int:
+        """Successeur d'un ensemble d'états (masque) par un symbole."""
+        suivant = 0
+        for i in _indices_masque(masque):
+            suivant |= successeurs_symbole[i]
+        return suivant
+
+    @staticmethod
+    def _mot_depuis_chemin(parents: Dict, noeud, symboles: List[str]) -> Mot:
+        """Reconstruit le mot menant à un nœud d'un parcours en largeur."""
+        lettres = []
+        while parents[noeud] is not None:
+            noeud, j = parents[noeud]
+            lettres.append(symboles[j])
+        return Mot("".join(reversed(lettres)), symboles)
+
+    def est_equivalent(self, autre: 'Automate') -> bool:
+        """Décide si les deux automates reconnaissent le même langage (voir contre_exemple_equivalence)."""
+        return self.contre_exemple_equivalence(autre) is None
+
+    def contre_exemple_equivalence(self, autre: 'Automate') -> Optional[Mot]:
+        """
+        Compare les langages des deux automates sans minimiser : algorithme
+        de Hopcroft-Karp (union-find sur les couples d'ensembles d'états,
+        déterminisés à la volée).
+
+        Les couples sont explorés en largeur et chacun garde le couple et
+        le symbole qui l'ont découvert : le premier couple en désaccord
+        donne directement un plus court contre-exemple, sans second
+        parcours (un couple écarté parce que déjà fusionné est relié, par
+        des fusions de profondeur moindre, à des couples explorés qui le
+        distinguent au plus tard à la même profondeur).
+
+        Returns:
+            None si les langages sont égaux, sinon un plus court mot reconnu
+            par un seul des deux automates
+        """
+        symboles, vues = self._vue_sous_ensembles(autre)
+        (init_a, succ_a, final_a), (init_b, succ_b, final_b) = vues
+
+        parent: Dict[tuple, tuple] = {}
+
+        def trouver(x: tuple) -> tuple:
+            racine = x
+            while parent.get(racine, racine) != racine:
+                racine = parent[racine]
+            while x != racine:
+                parent[x], x = racine, parent[x]
+            return racine
+
+        depart = (init_a, init_b)
+        chemins = {depart: None}
+        file = [depart]
+        parent[(1, init_b)] = (0, init_a)
+        for couple in file:
+            a, b = couple
+            if bool(a & final_a) != bool(b & final_b):
+                return self._mot_depuis_chemin(chemins, couple, symboles)
+            for j in range(len(symboles)):
+                a2 = self._avancer_masque(a, succ_a[j])
+                b2 = self._avancer_masque(b, succ_b[j])
+                racine_a, racine_b = trouver((0, a2)), trouver((1, b2))
+                if racine_a != racine_b:
+                    parent[racine_b] = racine_a
+                    chemins[(a2, b2)] = (couple, j)
+                    file.append((a2, b2))
+        return None
+
+    def est_inclus_dans(self, autre: 'Automate') -> bool:
+        """Décide si L(self) ⊆ L(autre) (voir contre_exemple_inclusion)."""
+        return self.contre_exemple_inclusion(autre) is None
+
+    def contre_exemple_inclusion(self, autre: 'Automate') -> Optional[Mot]:
+        """
+        Teste L(self) ⊆ L(autre) par exploration des couples (état de self,
+        ensemble d'états de autre) avec élagage par antichaînes : un couple
+        (p, S) est ignoré si un couple (p, S') avec S' ⊆ S a déjà été vu.
+        Le parcours en largeur donne un plus court contre-exemple.
+
+        Returns:
+            None si l'inclusion est vraie, sinon un plus court mot de L(self)
+            absent de L(autre)
+        """
+        symboles, vues = self._vue_sous_ensembles(autre)
+        (init_a, succ_a, final_a), (init_b, succ_b, final_b) = vues
+
+        # Si autre est déterministe, ses ensembles ont au plus un état :
+        # S' ⊆ S se réduit alors à S' = S ou S' = ∅ (test en temps constant)
+        autre_deterministe = all(masque & (masque - 1) == 0
+                                 for ligne in succ_b for masque in ligne)
+
+        antichaines: Dict[int, List[int]] = {}
+        parents = {}
+        file = []
+
+        def visiter(p: int, ensemble: int, origine) -> None:
+            if (p, ensemble) in parents or (p, 0) in parents:
+                return
+            if not autre_deterministe:
+                deja_vus = antichaines.setdefault(p, [])
+                for vu in deja_vus:
+                    if vu & ~ensemble == 0:
+                        return
+                deja_vus[:] = [vu for vu in deja_vus if ensemble & ~vu != 0]
+                deja_vus.append(ensemble)
+            parents[(p, ensemble)] = origine
+            file.append((p, ensemble))
+
+        for p in _indices_masque(init_a):
+            visiter(p, init_b, None)
+
+        for couple in file:
+            p, ensemble = couple
+            if (final_a >> p) & 1 and not ensemble & final_b:
+                return self._mot_depuis_chemin(parents, couple, symboles)
+            for j in range(len(symboles)):
+                successeurs_p = succ_a[j][p]
+                if not successeurs_p:
+                    continue
+                ensemble2 = self._avancer_masque(ensemble, succ_b[j])
+                for p2 in _indices_masque(successeurs_p):
+                    visiter(p2, ensemble2, (couple, j))
+        return None
+
+    def _classe_structurelle(self) -> type:
+        """Classe de la hiérarchie du cours (Automate, ADC, AFDC, AND, AFND, AFNS) de l'automate."""
+        return next(classe for classe in type(self).__mro__
+                    if classe in (AFNS, AFND, AND, AFDC, ADC, Automate))
+
+    def emonder(self) -> 'Automate':
+        """
+        Retourne l'automate émondé : seuls les états à la fois accessibles
+        (parcours en largeur depuis l'état initial) et coaccessibles
+        (parcours en largeur inverse depuis les états finaux) sont gardés,
+        en O(|Q| + |δ|). L'état initial est toujours conservé.
+        """
+        index = self.index_graphe()
+        utiles = {etat for etat in index.etats
+                  if index.est_accessible(etat) and index.est_coaccessible(etat)}
+        utiles.add(self.etat_initial)
+        nouveaux = {etat: Etat(etat.nom) for etat in utiles}
+
+        emonde = self._classe_structurelle()(
+            set(self.alphabet), etats=set(nouveaux.values()),
+            etat_initial=nouveaux[self.etat_initial],
+            etats_finaux={nouveaux[etat] for etat in self.etats_finaux if etat in utiles})
+        for source, sorties in self.transitions.items():
+            if source not in utiles:
+                continue
+            for symbole, destinations in sorties.items():
+                for destination in destinations:
+                    if destination in utiles:
+                        emonde.ajouter_transition(nouveaux[source], symbole, nouveaux[destination])
+        return emonde
+
+    def union(self, autre: 'Automate') -> 'AFDC':
+        """Automate produit reconnaissant L(self) ∪ L(autre)."""
+        return construire_produit([self, autre], any)[0]
+
+    def intersection(self, autre: 'Automate') -> 'AFDC':
+        """
+        Automate produit reconnaissant L(self) ∩ L(autre) ; un couple dont
+        une composante est bloquée est mort et n'est pas exploré.
+        """
+        return construire_produit([self, autre], all,
+                                  lambda couple: couple[0] < 0 or couple[1] < 0)[0]
+
+    def difference(self, autre: 'Automate') -> 'AFDC':
+        """
+        Automate produit reconnaissant L(self) \\ L(autre) ; un couple dont la
+        première composante est bloquée est mort et n'est pas exploré.
+        """
+        return construire_produit([self, autre], lambda finaux: finaux[0] and not finaux[1],
+                                  lambda couple: couple[0] < 0)[0]
+
     def est_deterministe(self) -> bool:
         """Vérifie si l'automate est déterministe."""
         """
@@ -173,44 +736,81 @@ class ADC(Automate):
     
     Surcharge des méthodes de l'automate pour respecter les propriétés
     spécifiques aux ADC (déterminisme et complétude).
+    La reconnaissance s'exécute sur la table compilée (voir compiler()).
     """
     
     def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, 
                  etats_finaux: Set[str]) -> None:
         """Initialise un ADC."""
-        pass
+        super().__init__(alphabet, etats_finaux=etats_finaux, etats=etats,
+                         etat_initial=etat_initial)
+        self._puits = None
     
     def ajouter_transition(self, etat_source: str, symbole: str, etat_cible: str) -> None:
-        """Ajoute une transition en respectant le déterminisme."""
-        pass
+        """
+        Ajoute une transition en respectant le déterminisme ; une transition
+        vers l'état puits (ajoutée par completer() ou supprimer_transition())
+        est remplacée.
+        """
+        existantes = self.transitions.get(etat_source, {}).get(symbole)
+        if existantes and etat_cible not in existantes:
+            if self._puits is None or existantes != {self._puits}:
+                raise ValueError(f"Transition déjà définie depuis {etat_source} avec '{symbole}'")
+            existantes.clear()
+        super().ajouter_transition(etat_source, symbole, etat_cible)
     
     def supprimer_transition(self, etat_source: str, symbole: str, etat_cible: str) -> None:
         """Supprime une transition en maintenant la complétude."""
-        pass
+        super().supprimer_transition(etat_source, symbole, etat_cible)
+        # La transition supprimée est redirigée vers l'état puits
+        puits = self._etat_puits()
+        if etat_cible != puits:
+            super().ajouter_transition(etat_source, symbole, puits)
     
     def obtenir_transitions(self, etat: str, symbole: str) -> Set[str]:
         """Retourne exactement un état (déterminisme)."""
-        pass
+        cible = self.compiler().transition(etat, symbole)
+        return {cible} if cible is not None else set()
     
     def reconnaitre_mot(self, mot: str) -> bool:
         """Reconnaissance déterministe d'un mot."""
-        pass
+        return self.compiler().reconnaitre(mot)
     
     def est_deterministe(self) -> bool:
         """Retourne toujours True pour un ADC."""
-        pass
+        return True
     
     def est_complet(self) -> bool:
-        """Retourne toujours True pour un ADC."""
-        pass
+        """Vérifie la complétude directement sur la table compilée."""
+        return self.compiler().est_complete()
+    
+    def _etat_puits(self) -> Etat:
+        """Retourne l'état puits de l'automate, en le créant au besoin."""
+        if self._puits is None:
+            noms_existants = {etat.nom for etat in self.etats}
+            nom = "puits"
+            while nom in noms_existants:
+                nom += "'"
+            self._puits = Etat(nom)
+            self._puits.rattacher(self)
+            self.etats.add(self._puits)
+            for symbole in self.alphabet:
+                super().ajouter_transition(self._puits, symbole, self._puits)
+        return self._puits
     
     def completer(self) -> None:
         """Complète l'automate s'il ne l'est pas déjà."""
-        pass
+        if self.est_complet():
+            return
+        puits = self._etat_puits()
+        for etat in list(self.etats):
+            for symbole in self.alphabet:
+                if not self.transitions.get(etat, {}).get(symbole):
+                    super().ajouter_transition(etat, symbole, puits)
     
     def afficher(self) -> str:
         """Affichage spécifique aux ADC."""
-        pass
+        return f"Type: {type(self).__name__} ({len(self.etats)} états)\n" + super().afficher()
 
 
 class AFDC(ADC):
@@ -223,19 +823,391 @@ class AFDC(ADC):
     def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, 
                  etats_finaux: Set[str]) -> None:
         """Initialise un AFDC."""
-        pass
+        super().__init__(alphabet, etats, etat_initial, etats_finaux)
+
+    @classmethod
+    def depuis_table(cls, table: TableTransitions, alphabet: Optional[Set[str]] = None) -> 'AFDC':
+        """
+        Reconstruit un automate indépendant depuis une table compilée : les
+        états sont neufs (mêmes noms), la table n'est pas modifiée.
+        """
+        etats = [Etat(str(etat)) for etat in table.etats]
+        afdc = cls(set(alphabet) if alphabet is not None else set(table.symboles), set(etats),
+                   etats[0], {etat for i, etat in enumerate(etats) if table.finaux[i]})
+        m = table.nb_symboles
+        for i, source in enumerate(etats):
+            for j, symbole in enumerate(table.symboles):
+                k = table.table[i * m + j]
+                if k >= 0:
+                    afdc.ajouter_transition(source, symbole, etats[k])
+        return afdc
+
+    @classmethod
+    def depuis_trie(cls, trie: Trie, alphabet: Optional[Set[str]] = None) -> 'AFDC':
+        """
+        Automate d'un langage fini rangé en trie (ou en DAWG) : un état par
+        nœud, nommé par le premier préfixe qui l'atteint (ε pour la racine).
+        Les transitions absentes mènent à un état puits.
+        """
+        symboles = set(alphabet) if alphabet is not None else set()
+        etats = {trie.racine: Etat("ε")}
+        ordre = [trie.racine]
+        aretes = []
+        for noeud in ordre:
+            source = etats[noeud]
+            for symbole, enfant in trie.enfants(noeud):
+                cible = etats.get(enfant)
+                if cible is None:
+                    cible = Etat(source.nom + symbole if source.nom != "ε" else symbole)
+                    etats[enfant] = cible
+                    ordre.append(enfant)
+                symboles.add(symbole)
+                aretes.append((source, symbole, cible))
+
+        afdc = cls(symboles, set(etats.values()), etats[trie.racine],
+                   {etats[noeud] for noeud in ordre if trie.est_final(noeud)})
+        for source, symbole, cible in aretes:
+            afdc.ajouter_transition(source, symbole, cible)
+        afdc.completer()
+        return afdc
     
     def est_fini(self) -> bool:
         """Vérifie que l'automate est fini."""
         pass
     
+    def quotient_gauche(self, diviseur: Union[Langage, Automate]) -> 'AFDC':
+        """
+        Automate minimal du quotient gauche K⁻¹·L = {s : u·s ∈ L, u ∈ K}.
+
+        Les états atteints depuis l'état initial par les mots de K (parcours
+        du trie de K, ou des couples accessibles du produit avec l'automate
+        de K) forment l'ensemble de départ, déterminisé par masques de bits.
+
+        Args:
+            diviseur: Langage fini K, ou automate reconnaissant K
+        """
+        table = self.compiler()
+        departs = 0
+        if isinstance(diviseur, Langage):
+            trie = diviseur.index_trie()
+            pile = [(trie.racine, 0)]
+            vus = set()
+            while pile:
+                noeud, i = pile.pop()
+                if trie.est_final(noeud):
+                    departs |= 1 << i
+                for symbole, enfant in trie.enfants(noeud):
+                    j = table.indices_symboles.get(symbole)
+                    k = table.suivant(i, j) if j is not None else -1
+                    if k >= 0 and (enfant, k) not in vus:
+                        vus.add((enfant, k))
+                        pile.append((enfant, k))
+        else:
+            autre = _tables_deterministes([diviseur])[0]
+            communs = [(j, autre.indices_symboles[symbole]) for j, symbole in enumerate(table.symboles)
+                       if symbole in autre.indices_symboles]
+            vus = {(0, 0)}
+            file = [(0, 0)]
+            for i, q in file:
+                if autre.finaux[q]:
+                    departs |= 1 << i
+                for j, j_autre in communs:
+                    couple = (table.suivant(i, j), autre.suivant(q, j_autre))
+                    if couple[0] >= 0 and couple[1] >= 0 and couple not in vus:
+                        vus.add(couple)
+                        file.append(couple)
+
+        etats, symboles, _, successeurs, masque_final = self._table_masques()
+        return _determiniser_masques(etats, symboles, departs, successeurs, masque_final).minimiser()
+
+    def quotient_droit(self, diviseur: Union[Langage, Automate]) -> 'AFDC':
+        """
+        Automate minimal du quotient droit L·K⁻¹ = {p : p·u ∈ L, u ∈ K}.
+
+        Mêmes transitions ; deviennent finaux les états depuis lesquels un
+        mot de K mène à un état final, calculés à rebours (de bas en haut
+        sur le trie de K, ou par parcours inverse des couples du produit
+        avec l'automate de K).
+
+        Args:
+            diviseur: Langage fini K, ou automate reconnaissant K
+        """
+        table = self.compiler()
+        n, m = table.nb_etats, table.nb_symboles
+        predecesseurs = [[[] for _ in range(n)] for _ in range(m)]
+        for i in range(n):
+            for j in range(m):
+                k = table.table[i * m + j]
+                if k >= 0:
+                    predecesseurs[j][k].append(i)
+        finaux = 0
+        for i in range(n):
+            if table.finaux[i]:
+                finaux |= 1 << i
+
+        if isinstance(diviseur, Langage):
+            # antecedents[N] : états depuis lesquels un mot du sous-arbre de N mène à un état final
+            antecedents: Dict[int, int] = {}
+            trie = diviseur.index_trie()
+            pile = [(trie.racine, False)]
+            while pile:
+                noeud, visite = pile.pop()
+                if noeud in antecedents:
+                    continue
+                if not visite:
+                    pile.append((noeud, True))
+                    pile.extend((enfant, False) for _, enfant in trie.enfants(noeud)
+                                if enfant not in antecedents)
+                    continue
+                masque = finaux if trie.est_final(noeud) else 0
+                for symbole, enfant in trie.enfants(noeud):
+                    j = table.indices_symboles.get(symbole)
+                    if j is None:
+                        continue
+                    for k in _indices_masque(antecedents[enfant]):
+                        for i in predecesseurs[j][k]:
+                            masque |= 1 << i
+                antecedents[noeud] = masque
+            nouveaux_finaux = antecedents[trie.racine]
+        else:
+            autre = _tables_deterministes([diviseur])[0]
+            predecesseurs_autre = [[[] for _ in range(autre.nb_etats)] for _ in range(autre.nb_symboles)]
+            for q in range(autre.nb_etats):
+                for j in range(autre.nb_symboles):
+                    r = autre.suivant(q, j)
+                    if r >= 0:
+                        predecesseurs_autre[j][r].append(q)
+            communs = [(j, autre.indices_symboles[symbole]) for j, symbole in enumerate(table.symboles)
+                       if symbole in autre.indices_symboles]
+
+            file = [(i, q) for i in range(n) if table.finaux[i]
+                    for q in range(autre.nb_etats) if autre.finaux[q]]
+            vus = set(file)
+            for k, r in file:
+                for j, j_autre in communs:
+                    for i in predecesseurs[j][k]:
+                        for q in predecesseurs_autre[j_autre][r]:
+                            if (i, q) not in vus:
+                                vus.add((i, q))
+                                file.append((i, q))
+            nouveaux_finaux = 0
+            for i, q in vus:
+                if q == 0:
+                    nouveaux_finaux |= 1 << i
+
+        etats, symboles, initial, successeurs, _ = self._table_masques()
+        return _determiniser_masques(etats, symboles, initial, successeurs, nouveaux_finaux).minimiser()
+
+    def monoide_transitions(self, max_elements: Optional[int] = None) -> Monoids:
+        """
+        Monoïde des transitions : les éléments sont les applications des
+        états induites par les mots, codées en tuples d'indices (ordre de la
+        table compilée, l'indice n désignant l'absence de transition).
+
+        Clôture par parcours en largeur depuis l'identité (mot vide) avec
+        déduplication par hachage ; la table de Cayley est remplie en
+        O(|M|²) par le graphe de Cayley droit, sans recomposer les tuples.
+
+        Args:
+            max_elements: Nombre maximal d'éléments ; ValueError au-delà
+
+        Returns:
+            Monoids à table de Cayley, l'identité en indice 0, les lettres
+            (dans l'ordre des symboles) comme générateurs
+        """
+        table = self.compiler()
+        n = table.nb_etats
+        m = table.nb_symboles
+        lettres = [tuple(k if k >= 0 else n for k in table.table[j::m]) + (n,)
+                   for j in range(m)]
+
+        identite = tuple(range(n + 1))
+        elements = [identite]
+        indices = {identite: 0}
+        peres = [-1]
+        derniere_lettre = [-1]
+        droite = []
+        for x in elements:
+            ligne = array('i', [0]) * m
+            for j, lettre in enumerate(lettres):
+                produit = tuple(lettre[k] for k in x)
+                y = indices.get(produit)
+                if y is None:
+                    y = len(elements)
+                    if max_elements is not None and y >= max_elements:
+                        raise ValueError(f"Monoïde de plus de {max_elements} éléments")
+                    indices[produit] = y
+                    elements.append(produit)
+                    peres.append(indices[x])
+                    derniere_lettre.append(j)
+                ligne[j] = y
+            droite.append(ligne)
+
+        # x·y = (x·pere(y))·lettre(y), les éléments étant en ordre de parcours
+        taille = len(elements)
+        cayley = []
+        for x in range(taille):
+            ligne = array('i', [x]) * taille
+            for y in range(1, taille):
+                ligne[y] = droite[ligne[peres[y]]][derniere_lettre[y]]
+            cayley.append(ligne)
+
+        generateurs = [elements[droite[0][j]] for j in range(m)]
+        return Monoids.depuis_table(elements, cayley, 0, generateurs)
+
+    def monoide_syntaxique(self, max_elements: Optional[int] = None) -> Monoids:
+        """Monoïde syntaxique du langage : monoïde des transitions de l'automate minimal."""
+        return self.minimiser().monoide_transitions(max_elements)
+
     def minimiser(self) -> 'AFDC':
         """Retourne l'automate minimal équivalent."""
-        pass
+        return self.minimiser_avec_correspondance()[0]
+
+    def minimiser_avec_correspondance(self) -> Tuple['AFDC', Dict[Etat, Etat]]:
+        """
+        Minimisation par l'algorithme de Hopcroft (raffinement de partition),
+        en O(n·|Σ|·log n) grâce aux index de transitions inverses.
+
+        Seuls les états accessibles sont conservés ; un état puits est ajouté
+        si la table compilée n'est pas complète.
+
+        Returns:
+            (automate minimal, correspondance ancien état accessible -> nouvel état)
+        """
+        table = self.compiler()
+        t = table.table
+        m = table.nb_symboles
+
+        # États accessibles depuis l'état initial (indice 0)
+        vu = bytearray(table.nb_etats)
+        vu[0] = 1
+        ordre = [0]
+        besoin_puits = False
+        for i in ordre:
+            for j in range(m):
+                k = t[i * m + j]
+                if k < 0:
+                    besoin_puits = True
+                elif not vu[k]:
+                    vu[k] = 1
+                    ordre.append(k)
+
+        rang = {ancien: nouveau for nouveau, ancien in enumerate(ordre)}
+        puits = len(ordre)
+        n = puits + 1 if besoin_puits else puits
+
+        # Index des transitions inverses : inverse[j][q] = prédécesseurs de q par j
+        inverse = [[[] for _ in range(n)] for _ in range(m)]
+        for p in range(n):
+            for j in range(m):
+                k = t[ordre[p] * m + j] if p < puits else -1
+                inverse[j][rang[k] if k >= 0 else puits].append(p)
+
+        finaux = {p for p in range(puits) if table.finaux[ordre[p]]}
+        non_finaux = set(range(n)) - finaux
+        blocs = [set(bloc) for bloc in (finaux, non_finaux) if bloc]
+        bloc_de = [0] * n
+        for b, bloc in enumerate(blocs):
+            for p in bloc:
+                bloc_de[p] = b
+
+        attente = set()
+        pile = []
+
+        def ajouter(b: int, j: int) -> None:
+            if (b, j) not in attente:
+                attente.add((b, j))
+                pile.append((b, j))
+
+        if len(blocs) == 2:
+            plus_petit = 0 if len(blocs[0]) <= len(blocs[1]) else 1
+            for j in range(m):
+                ajouter(plus_petit, j)
+
+        while pile:
+            b, j = pile.pop()
+            attente.discard((b, j))
+            inverse_j = inverse[j]
+
+            touches: Dict[int, List[int]] = {}
+            for q in blocs[b]:
+                for p in inverse_j[q]:
+                    touches.setdefault(bloc_de[p], []).append(p)
+
+            for y, membres in touches.items():
+                if len(membres) == len(blocs[y]):
+                    continue
+                z = len(blocs)
+                nouveau = set(membres)
+                blocs[y] -= nouveau
+                blocs.append(nouveau)
+                for p in membres:
+                    bloc_de[p] = z
+                for c in range(m):
+                    if (y, c) in attente or len(nouveau) <= len(blocs[y]):
+                        ajouter(z, c)
+                    else:
+                        ajouter(y, c)
+
+        # Chaque bloc est nommé d'après son représentant de plus petit rang
+        noms_existants = {str(etat) for etat in table.etats}
+        nom_puits = "puits"
+        while nom_puits in noms_existants:
+            nom_puits += "'"
+        nouveaux = []
+        for bloc in blocs:
+            representant = min(bloc)
+            nouveaux.append(Etat(str(table.etats[ordre[representant]])
+                                 if representant < puits else nom_puits))
+
+        minimal = AFDC(set(table.symboles), set(nouveaux), nouveaux[bloc_de[0]],
+                       {nouveaux[bloc_de[p]] for p in finaux})
+        for b, bloc in enumerate(blocs):
+            p = next(iter(bloc))
+            for j in range(m):
+                k = t[ordre[p] * m + j] if p < puits else -1
+                cible = rang[k] if k >= 0 else puits
+                minimal.ajouter_transition(nouveaux[b], table.symboles[j],
+                                           nouveaux[bloc_de[cible]])
+
+        correspondance = {table.etats[ordre[p]]: nouveaux[bloc_de[p]] for p in range(puits)}
+        return minimal, correspondance
     
-    def complementaire(self) -> 'AFDC':
-        """Retourne l'automate complémentaire."""
-        pass
+    def complementaire(self, alphabet: Optional[Set[str]] = None) -> 'AFDC':
+        """
+        Retourne l'automate complémentaire : l'automate est complété (état
+        puits) puis ses états finaux et non finaux sont échangés.
+
+        Args:
+            alphabet: Alphabet de référence du complément, s'il est plus grand
+        """
+        table = self.compiler()
+        symboles = sorted(set(table.symboles) | set(alphabet or ()))
+        etats = [Etat(str(etat)) for etat in table.etats]
+
+        noms_existants = {etat.nom for etat in self.etats}
+        nom_puits = "puits"
+        while nom_puits in noms_existants:
+            nom_puits += "'"
+        puits = Etat(nom_puits)
+
+        transitions = []
+        for i, etat in enumerate(etats):
+            for symbole in symboles:
+                j = table.indices_symboles.get(symbole)
+                k = table.table[i * table.nb_symboles + j] if j is not None else -1
+                transitions.append((etat, symbole, etats[k] if k >= 0 else puits))
+        besoin_puits = any(cible is puits for _, _, cible in transitions)
+        if besoin_puits:
+            etats.append(puits)
+            transitions.extend((puits, symbole, puits) for symbole in symboles)
+
+        finaux = {etat for i, etat in enumerate(etats)
+                  if i >= table.nb_etats or not table.finaux[i]}
+        complement = AFDC(set(symboles), set(etats), etats[0], finaux)
+        for source, symbole, cible in transitions:
+            complement.ajouter_transition(source, symbole, cible)
+        return complement
 
 
 class AND(Automate):
@@ -249,39 +1221,78 @@ class AND(Automate):
     def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, 
                  etats_finaux: Set[str]) -> None:
         """Initialise un AND."""
-        pass
+        super().__init__(alphabet, etats_finaux=etats_finaux, etats=etats,
+                         etat_initial=etat_initial)
+        self._cache_determinisation = None
+
+    def _invalider_caches(self) -> None:
+        """Oublie aussi les sous-ensembles construits à la volée."""
+        super()._invalider_caches()
+        self._cache_determinisation = None
     
     def ajouter_transition(self, etat_source: str, symbole: str, etat_cible: str) -> None:
         """Ajoute une transition non déterministe."""
-        pass
+        super().ajouter_transition(etat_source, symbole, etat_cible)
     
     def supprimer_transition(self, etat_source: str, symbole: str, etat_cible: str) -> None:
         """Supprime une transition non déterministe."""
-        pass
+        super().supprimer_transition(etat_source, symbole, etat_cible)
     
     def obtenir_transitions(self, etat: str, symbole: str) -> Set[str]:
         """Retourne un ensemble d'états (non déterminisme)."""
-        pass
+        return super().obtenir_transitions(etat, symbole)
     
     def reconnaitre_mot(self, mot: str) -> bool:
         """Reconnaissance non déterministe d'un mot."""
-        pass
+        return self._reconnaitre_iteratif(mot)
+
+    def cache_determinisation(self, capacite: int = 4096) -> CacheDeterminisation:
+        """Retourne le cache de déterminisation paresseuse de l'automate."""
+        cache = self._cache_determinisation
+        if cache is None or cache.capacite != capacite:
+            cache = CacheDeterminisation(self, capacite)
+            self._cache_determinisation = cache
+        return cache
+
+    def reconnaitre_mot_paresseux(self, mot: str, capacite: int = 4096) -> bool:
+        """
+        Reconnaissance par déterminisation à la volée : seuls les
+        sous-ensembles atteints par les mots lus sont construits, et ils
+        sont conservés d'un mot à l'autre dans un cache LRU borné.
+        """
+        return self.cache_determinisation(capacite).reconnaitre(mot)
     
     def est_deterministe(self) -> bool:
         """Vérifie le déterminisme."""
-        pass
+        return super().est_deterministe()
     
     def est_complet(self) -> bool:
         """Vérifie la complétude."""
-        pass
+        return super().est_complet()
     
-    def determiniser(self) -> ADC:
-        """Convertit en automate déterministe équivalent."""
-        pass
+    def determiniser(self, max_etats: Optional[int] = None,
+                     progression: Optional[callable] = None) -> 'AFDC':
+        """
+        Convertit en automate déterministe équivalent (construction des
+        sous-ensembles).
+
+        Les sous-ensembles sont des masques de bits sur les indices des états,
+        mémorisés dans une table (masque -> indice) : seuls les sous-ensembles
+        accessibles depuis l'état initial sont construits, par liste de
+        travail. Le sous-ensemble vide sert d'état puits, l'AFDC obtenu est
+        donc complet.
+
+        Args:
+            max_etats: Nombre maximal d'états de l'AFDC (ValueError au-delà)
+            progression: Fonction appelée avec (nb_etats_construits, nb_en_attente)
+        """
+        etats, symboles, initial, successeurs, masque_final = self._table_masques()
+        return _determiniser_masques(etats, symboles, initial, successeurs, masque_final,
+                                     max_etats, progression)
     
     def afficher(self) -> str:
         """Affichage spécifique aux AND."""
-        pass
+        return f"Type: {type(self).__name__} ({len(self.etats)} états)\n" + super().afficher()
 
 
 class AFND(AND):
@@ -299,15 +1310,16 @@ class AFND(AND):
     def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, 
                  etats_finaux: Set[str]) -> None:
         """Initialise un AFND."""
-        pass
+        super().__init__(alphabet, etats, etat_initial, etats_finaux)
     
     def est_fini(self) -> bool:
         """Vérifie que l'automate est fini."""
         pass
     
-    def construction_sous_ensembles(self) -> AFDC:
+    def construction_sous_ensembles(self, max_etats: Optional[int] = None,
+                                    progression: Optional[callable] = None) -> AFDC:
         """Algorithme de construction des sous-ensembles pour déterminiser."""
-        pass
+        return self.determiniser(max_etats, progression)
 
 
 class AFNS(AFND):
@@ -325,39 +1337,320 @@ class AFNS(AFND):
     def __init__(self, alphabet: Set[str], etats: Set[str], etat_initial: str, 
                  etats_finaux: Set[str]) -> None:
         """Initialise un AFNS."""
-        pass
+        super().__init__(alphabet, etats, etat_initial, etats_finaux)
+        self._fermetures = None
+
+    def _invalider_caches(self) -> None:
+        """Oublie aussi l'index des ε-fermetures."""
+        super()._invalider_caches()
+        self._fermetures = None
     
     def ajouter_transition_epsilon(self, etat_source: str, etat_cible: str) -> None:
         """Ajoute une ε-transition."""
-        pass
+        self.ajouter_transition(etat_source, EPSILON, etat_cible)
     
     def supprimer_transition_epsilon(self, etat_source: str, etat_cible: str) -> None:
         """Supprime une ε-transition."""
-        pass
+        self.supprimer_transition(etat_source, EPSILON, etat_cible)
+
+    def _index_fermetures(self) -> Tuple[List[Etat], Dict[Etat, int], List[int], Dict[Etat, frozenset]]:
+        """
+        Calcule en une passe les ε-fermetures de tous les états.
+
+        Le graphe des ε-transitions est condensé en composantes fortement
+        connexes (Tarjan, itératif) ; Tarjan produit les composantes dans
+        l'ordre topologique inverse, la fermeture d'une composante est donc
+        l'union (OU de masques de bits) de ses membres et des fermetures
+        déjà calculées de ses successeurs.
+        L'index est conservé jusqu'à la prochaine modification des transitions.
+
+        Returns:
+            (etats, index, masques, fermetures) où masques[i] est la fermeture
+            de l'état i en masque de bits, et fermetures un cache état -> frozenset
+        """
+        if self._fermetures is not None:
+            return self._fermetures
+
+        etats = self._ordre_etats()
+        index = {etat: i for i, etat in enumerate(etats)}
+        n = len(etats)
+        voisins = [[] for _ in range(n)]
+        for source, sorties in self.transitions.items():
+            destinations = sorties.get(EPSILON)
+            if destinations:
+                voisins[index[source]] = [index[d] for d in destinations]
+
+        composante, composantes = composantes_fortement_connexes(voisins)
+
+        fermetures_composantes = []
+        for c, membres in enumerate(composantes):
+            masque = 0
+            for v in membres:
+                masque |= 1 << v
+            for v in membres:
+                for w in voisins[v]:
+                    if composante[w] != c:
+                        masque |= fermetures_composantes[composante[w]]
+            fermetures_composantes.append(masque)
+
+        masques = [fermetures_composantes[composante[v]] for v in range(n)]
+        self._fermetures = (etats, index, masques, {})
+        return self._fermetures
     
     def epsilon_fermeture(self, etat: str) -> Set[str]:
         """Calcule l'ε-fermeture d'un état."""
-        pass
+        etats, index, masques, fermetures = self._index_fermetures()
+        fermeture = fermetures.get(etat)
+        if fermeture is None:
+            fermeture = frozenset(etats[i] for i in _indices_masque(masques[index[etat]]))
+            fermetures[etat] = fermeture
+        return set(fermeture)
     
     def epsilon_fermeture_ensemble(self, ensemble_etats: Set[str]) -> Set[str]:
         """Calcule l'ε-fermeture d'un ensemble d'états."""
-        pass
+        etats, index, masques, _ = self._index_fermetures()
+        masque = 0
+        for etat in ensemble_etats:
+            masque |= masques[index[etat]]
+        return {etats[i] for i in _indices_masque(masque)}
+
+    def _fermeture(self, ensemble: Set[Etat]) -> Set[Etat]:
+        """Complète un ensemble d'états par ses ε-transitions."""
+        return self.epsilon_fermeture_ensemble(ensemble)
+
+    def _frontiere_initiale(self) -> Set[Etat]:
+        """Les états actifs au départ sont l'ε-fermeture de l'état initial."""
+        return self.epsilon_fermeture(self.etat_initial)
+
+    def _avancer_frontiere(self, frontiere: Set[Etat], symboles,
+                           arret_anticipe: bool = True) -> Set[Etat]:
+        """Fait avancer un ensemble d'états actifs, en fermant par ε après chaque symbole."""
+        for symbole in symboles:
+            frontiere = self.transiter(frontiere, symbole)
+            if not frontiere and arret_anticipe:
+                break
+        return frontiere
     
     def transiter(self, ensemble_etats: Set[str], symbole: str) -> Set[str]:
         """Calcule les transitions depuis un ensemble d'états avec un symbole."""
-        pass
+        etats, index, masques, _ = self._index_fermetures()
+        transitions = self.transitions
+        masque = 0
+        for etat in ensemble_etats:
+            sorties = transitions.get(etat)
+            if sorties is not None:
+                destinations = sorties.get(symbole)
+                if destinations:
+                    for destination in destinations:
+                        masque |= masques[index[destination]]
+        return {etats[i] for i in _indices_masque(masque)}
+
+    def est_deterministe(self) -> bool:
+        """Un automate avec des ε-transitions n'est pas déterministe."""
+        if any(EPSILON in sorties for sorties in self.transitions.values()):
+            return False
+        return super().est_deterministe()
+
+    def _table_masques(self) -> Tuple[List[Etat], List[str], int, List[List[int]], int]:
+        """Table des masques où chaque ensemble de successeurs est ε-fermé."""
+        etats, symboles, _, successeurs, masque_final = super()._table_masques()
+        _, _, masques, _ = self._index_fermetures()
+
+        def fermer(masque: int) -> int:
+            ferme = 0
+            for i in _indices_masque(masque):
+                ferme |= masques[i]
+            return ferme
+
+        successeurs = [[fermer(masque) if masque else 0 for masque in ligne]
+                       for ligne in successeurs]
+        return etats, symboles, masques[0], successeurs, masque_final
     
-    def construction_sous_ensembles(self) -> AFDC:
+    def construction_sous_ensembles(self, max_etats: Optional[int] = None,
+                                    progression: Optional[callable] = None) -> AFDC:
         """
         Construction des sous-ensembles.
         Entrée: Un AFNS
         Sortie: Un AFDC équivalent
         """
-        pass
+        return self.determiniser(max_etats, progression)
     
     def eliminer_epsilon_transitions(self) -> AFND:
-        """Élimine les ε-transitions pour obtenir un AFND équivalent."""
-        pass
+        """
+        Élimine les ε-transitions pour obtenir un AFND équivalent :
+        δ'(p, a) = ⋃ δ(q, a) pour q dans l'ε-fermeture de p, et p est final
+        si sa fermeture contient un état final.
+
+        Les unions sont des OU de masques de bits, calculées une seule fois
+        par fermeture distincte (les états d'une même composante ε partagent
+        leur fermeture). Seuls les états accessibles depuis l'état initial
+        sont parcourus et conservés.
+        """
+        etats, symboles, _, successeurs, masque_final = super()._table_masques()
+        _, _, masques, _ = self._index_fermetures()
+
+        lignes_par_fermeture: Dict[int, List[int]] = {}
+        lignes = {}
+        atteints = 1
+        a_traiter = [0]
+        while a_traiter:
+            p = a_traiter.pop()
+            fermeture = masques[p]
+            ligne = lignes_par_fermeture.get(fermeture)
+            if ligne is None:
+                membres = _indices_masque(fermeture)
+                ligne = []
+                for successeurs_symbole in successeurs:
+                    masque = 0
+                    for q in membres:
+                        masque |= successeurs_symbole[q]
+                    ligne.append(masque)
+                lignes_par_fermeture[fermeture] = ligne
+            lignes[p] = ligne
+            for masque in ligne:
+                nouveaux_atteints = masque & ~atteints
+                if nouveaux_atteints:
+                    atteints |= nouveaux_atteints
+                    a_traiter.extend(_indices_masque(nouveaux_atteints))
+
+        nouveaux = {p: Etat(str(etats[p])) for p in lignes}
+        afnd = AFND(set(symboles), set(nouveaux.values()), nouveaux[0],
+                    {nouveaux[p] for p in lignes if masques[p] & masque_final})
+        for p, ligne in lignes.items():
+            for j, masque in enumerate(ligne):
+                for q in _indices_masque(masque):
+                    afnd.ajouter_transition(nouveaux[p], symboles[j], nouveaux[q])
+        return afnd
+
+
+def _determiniser_masques(etats: List[Etat], symboles: List[str], initial: int,
+                          successeurs: List[List[int]], masque_final: int,
+                          max_etats: Optional[int] = None,
+                          progression: Optional[callable] = None) -> 'AFDC':
+    """
+    Construction des sous-ensembles sur la représentation par masques de
+    bits (voir Automate._table_masques), depuis un ensemble de départ
+    quelconque.
+    """
+    decouverts = {initial: 0}
+    ordre = [initial]
+    table = []
+    k = 0
+    while k < len(ordre):
+        indices = _indices_masque(ordre[k])
+        k += 1
+        ligne = []
+        for successeurs_symbole in successeurs:
+            masque = 0
+            for i in indices:
+                masque |= successeurs_symbole[i]
+            cible = decouverts.get(masque)
+            if cible is None:
+                if max_etats is not None and len(ordre) >= max_etats:
+                    raise ValueError(f"La déterminisation dépasse {max_etats} états")
+                cible = len(ordre)
+                decouverts[masque] = cible
+                ordre.append(masque)
+            ligne.append(cible)
+        table.append(ligne)
+        if progression is not None:
+            progression(len(ordre), len(ordre) - k)
+
+    nouveaux = []
+    for masque in ordre:
+        noms = sorted(str(etats[i]).translate(_ECHAPPEMENT_ENSEMBLE) for i in _indices_masque(masque))
+        nouveaux.append(Etat("{" + ",".join(noms) + "}") if noms else Etat("∅"))
+
+    afdc = AFDC(set(symboles), set(nouveaux), nouveaux[0],
+                {nouveaux[i] for i, masque in enumerate(ordre) if masque & masque_final})
+    for i, ligne in enumerate(table):
+        for j, cible in enumerate(ligne):
+            afdc.ajouter_transition(nouveaux[i], symboles[j], nouveaux[cible])
+    return afdc
+
+
+def _tables_deterministes(automates: List[Automate]) -> List[TableTransitions]:
+    """Tables compilées des automates, déterminisés au besoin."""
+    tables = []
+    for automate in automates:
+        if not automate.est_deterministe():
+            if not isinstance(automate, AND):
+                raise ValueError(f"Automate non déterministe sans déterminisation : {automate!r}")
+            automate = automate.determiniser()
+        tables.append(automate.compiler())
+    return tables
+
+
+def construire_produit(automates: List[Automate], etiquette: callable,
+                       est_mort: Optional[callable] = None) -> Tuple[AFDC, Dict[Etat, Any]]:
+    """
+    Construction paresseuse de l'automate produit de plusieurs automates.
+
+    Un état du produit est un n-uplet d'indices des tables compilées (-1
+    quand une composante est bloquée). Seuls les n-uplets accessibles sont
+    construits, par liste de travail : la table |Q1|×...×|Qn| complète
+    n'est jamais allouée. Les n-uplets reconnus comme morts sont fusionnés
+    en un unique état puits.
+
+    Args:
+        automates: Automates composants (déterminisés au besoin)
+        etiquette: Fonction (n-uplet de booléens « composante finale ») -> étiquette ;
+            un état du produit est final si son étiquette est vraie
+        est_mort: Prédicat sur un n-uplet d'indices ; par défaut, toutes les
+            composantes sont bloquées
+
+    Returns:
+        (AFDC produit complet, étiquette de chaque état du produit)
+    """
+    tables = _tables_deterministes(automates)
+    symboles = sorted(set().union(*(table.symboles for table in tables)))
+    colonnes = [[table.indices_symboles.get(symbole, -1) for symbole in symboles]
+                for table in tables]
+    if est_mort is None:
+        est_mort = lambda n_uplet: all(i < 0 for i in n_uplet)
+
+    mort = tuple(-1 for _ in tables)
+    initial = tuple(0 for _ in tables)
+    if est_mort(initial):
+        initial = mort
+    decouverts = {initial: 0}
+    ordre = [initial]
+    lignes = []
+    k = 0
+    while k < len(ordre):
+        n_uplet = ordre[k]
+        k += 1
+        ligne = []
+        for g in range(len(symboles)):
+            suivant = tuple(
+                table.table[i * table.nb_symboles + colonne[g]] if i >= 0 and colonne[g] >= 0 else -1
+                for table, colonne, i in zip(tables, colonnes, n_uplet))
+            if suivant != mort and est_mort(suivant):
+                suivant = mort
+            cible = decouverts.get(suivant)
+            if cible is None:
+                cible = len(ordre)
+                decouverts[suivant] = cible
+                ordre.append(suivant)
+            ligne.append(cible)
+        lignes.append(ligne)
+
+    etats = []
+    etiquettes = {}
+    for n_uplet in ordre:
+        noms = ",".join(str(table.etats[i]).translate(_ECHAPPEMENT_PRODUIT) if i >= 0 else "⊥"
+                        for table, i in zip(tables, n_uplet))
+        etat = Etat(f"({noms})")
+        etats.append(etat)
+        etiquettes[etat] = etiquette(tuple(i >= 0 and table.finaux[i] == 1
+                                           for table, i in zip(tables, n_uplet)))
+
+    produit = AFDC(set(symboles), set(etats), etats[0],
+                   {etat for etat in etats if etiquettes[etat]})
+    for i, ligne in enumerate(lignes):
+        for j, cible in enumerate(ligne):
+            produit.ajouter_transition(etats[i], symboles[j], etats[cible])
+    return produit, etiquettes
 
 
 class AutomateCanonique(AFDC):
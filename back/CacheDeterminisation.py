@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from typing import Dict, Tuple, FrozenSet
+
+
+class CacheDeterminisation:
+    """
+    Déterminisation paresseuse (à la volée) d'un automate non déterministe.
+
+    Un état déterministe est un ensemble (frozenset) d'états de l'automate.
+    Il n'est construit que lorsque l'entrée l'atteint ; son successeur par
+    un symbole est calculé au premier passage avec obtenir_transitions,
+    puis mémorisé. Les lignes (sous-ensemble -> successeurs) sont gardées
+    dans un cache borné avec éviction LRU.
+
+    Si le cache s'effondre (plus d'évictions pendant un mot que sa
+    capacité), la fin du mot est lue par simulation d'ensembles classique.
+    """
+
+    def __init__(self, automate, capacite: int = 4096) -> None:
+        """
+        Initialise le cache.
+
+        Args:
+            automate: Automate source ; ses transitions restent la référence
+            capacite: Nombre maximal de sous-ensembles conservés
+        """
+        if capacite < 1:
+            raise ValueError("La capacité du cache doit être positive")
+        self.automate = automate
+        self.capacite = capacite
+        self._lignes: "OrderedDict[FrozenSet, Tuple[bool, Dict[str, FrozenSet]]]" = OrderedDict()
+        self._initial = frozenset(automate._frontiere_initiale())
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.replis = 0
+
+    def _ligne(self, sous_ensemble: FrozenSet) -> Tuple[bool, Dict[str, FrozenSet]]:
+        """Retourne (est_final, successeurs connus) d'un sous-ensemble."""
+        ligne = self._lignes.get(sous_ensemble)
+        if ligne is None:
+            ligne = (not sous_ensemble.isdisjoint(self.automate.etats_finaux), {})
+            self._lignes[sous_ensemble] = ligne
+            if len(self._lignes) > self.capacite:
+                self._lignes.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._lignes.move_to_end(sous_ensemble)
+        return ligne
+
+    def _successeur(self, sous_ensemble: FrozenSet, symbole: str) -> FrozenSet:
+        """Calcule le successeur d'un sous-ensemble depuis les transitions de l'automate."""
+        destinations = set()
+        for etat in sous_ensemble:
+            destinations |= self.automate.obtenir_transitions(etat, symbole)
+        return frozenset(self.automate._fermeture(destinations))
+
+    def reconnaitre(self, mot) -> bool:
+        """Détermine si un mot est reconnu, en construisant les états à la demande."""
+        courant = self._initial
+        ligne = self._ligne(courant)
+        evictions_depart = self.evictions
+        symboles = iter(mot)
+
+        for symbole in symboles:
+            suivant = ligne[1].get(symbole)
+            if suivant is None:
+                self.echecs += 1
+                suivant = self._successeur(courant, symbole)
+                ligne[1][symbole] = suivant
+            else:
+                self.succes += 1
+
+            courant = suivant
+            if not courant:
+                return False
+
+            if self.evictions - evictions_depart > self.capacite:
+                # Le cache ne tient plus : repli sur la simulation d'ensembles
+                self.replis += 1
+                frontiere = self.automate._avancer_frontiere(set(courant), symboles)
+                return not frontiere.isdisjoint(self.automate.etats_finaux)
+
+            ligne = self._ligne(courant)
+
+        return ligne[0]
+
+    def vider(self) -> None:
+        """Oublie tous les sous-ensembles construits."""
+        self._lignes.clear()
+        self._initial = frozenset(self.automate._frontiere_initiale())
+
+    def __len__(self) -> int:
+        return len(self._lignes)
+
+    def __repr__(self) -> str:
+        return (f"CacheDeterminisation({len(self._lignes)}/{self.capacite} sous-ensembles, "
+                f"{self.succes} succès, {self.echecs} échecs, {self.evictions} évictions)")
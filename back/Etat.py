@@ -1,11 +1,74 @@
+import weakref
 from typing import Set, Dict, List, Tuple, Optional, Union, Any
 
 
 
+class RegistreEtats:
+    """
+    Registre d'internement des noms d'états.
+    Chaque nom reçoit, à sa première apparition, un identifiant entier dense.
+    Le registre compte les états portant chaque nom : quand le dernier est
+    détruit, le nom est oublié et son identifiant réutilisé, si bien que le
+    registre ne retient que les noms des états vivants.
+    """
+
+    def __init__(self) -> None:
+        self._identifiants: Dict[str, int] = {}
+        self.noms: List[Optional[str]] = []
+        self._references: List[int] = []
+        self._libres: List[int] = []
+
+    def identifiant(self, nom: str) -> int:
+        """Retourne l'identifiant du nom (enregistré au besoin) pour un nouvel état."""
+        identifiant = self._identifiants.get(nom)
+        if identifiant is None:
+            if self._libres:
+                identifiant = self._libres.pop()
+                self.noms[identifiant] = nom
+            else:
+                identifiant = len(self.noms)
+                self.noms.append(nom)
+                self._references.append(0)
+            self._identifiants[nom] = identifiant
+        self._references[identifiant] += 1
+        return identifiant
+
+    def liberer(self, identifiant: int) -> None:
+        """Signale la destruction d'un état ; oublie le nom s'il n'est plus porté."""
+        self._references[identifiant] -= 1
+        if self._references[identifiant] == 0:
+            del self._identifiants[self.noms[identifiant]]
+            self.noms[identifiant] = None
+            self._libres.append(identifiant)
+
+    def nom(self, identifiant: int) -> str:
+        """Retourne le nom associé à un identifiant."""
+        return self.noms[identifiant]
+
+    def __len__(self) -> int:
+        """Nombre de noms portés par des états vivants."""
+        return len(self._identifiants)
+
+
+# Registre partagé : les états sont créés avant les automates et peuvent
+# appartenir à plusieurs d'entre eux, l'identifiant ne dépend donc que du nom
+REGISTRE_ETATS = RegistreEtats()
+
+
 class Etat:
     """
     Classe représentant un état dans un automate avec ses propriétés.
+
+    Représentation compacte (__slots__) : l'égalité et le hachage reposent
+    sur l'identifiant entier attribué au nom par le registre, sans hacher
+    de chaîne à chaque recherche dans les transitions.
+
+    Les requêtes sur le graphe (accessibilité, chemins...) portent sur
+    l'automate passé en argument, ou à défaut sur l'unique automate vivant
+    contenant l'état : si l'état est partagé, l'automate doit être précisé.
     """
+
+    __slots__ = ("id", "est_initial", "est_final", "_automates")
     
     def __init__(self, nom: str, est_initial = False, est_final = False) -> None:
         """
@@ -13,45 +76,95 @@ class Etat:
         
         Args:
             nom: Nom de l'état
-            suivant: etat(s) suivant ou sucesseurs de l'état courrant
-            transitions: valeures des transitions
+            est_initial: L'état est-il initial
+            est_final: L'état est-il final
         """
-        self.nom = nom
+        self.id = REGISTRE_ETATS.identifiant(nom)
         self.est_initial = est_initial
         self.est_final = est_final
-        
-    
-    def est_accessible(self) -> bool:
+        # Automates construits avec cet état (références faibles, renseignées par Automate)
+        self._automates = ()
+
+    @property
+    def nom(self) -> str:
+        """
+        Nom de l'état, lu dans le registre depuis l'identifiant : il est en
+        lecture seule, l'égalité et le hachage ne peuvent donc pas diverger
+        du nom affiché.
+        """
+        return REGISTRE_ETATS.noms[self.id]
+
+    def __del__(self) -> None:
+        # Le registre peut déjà avoir disparu à l'arrêt de l'interpréteur
+        if REGISTRE_ETATS is not None:
+            REGISTRE_ETATS.liberer(self.id)
+
+    def rattacher(self, automate) -> None:
+        """Enregistre un automate contenant cet état (les automates détruits sont oubliés)."""
+        vivants = tuple(reference for reference in self._automates
+                        if reference() is not None and reference() is not automate)
+        self._automates = vivants + (weakref.ref(automate),)
+
+    @property
+    def automate(self):
+        """
+        L'automate contenant cet état, ou None. Un état partagé par
+        plusieurs automates vivants n'en désigne aucun : ValueError.
+        """
+        vivants = [automate for automate in (reference() for reference in self._automates)
+                   if automate is not None]
+        if len(vivants) > 1:
+            raise ValueError(f"L'état {self.nom} appartient à plusieurs automates : "
+                             "préciser l'automate")
+        return vivants[0] if vivants else None
+
+    def _index(self, automate=None):
+        """Index du graphe de l'automate (donné, ou l'unique automate de l'état)."""
+        if automate is None:
+            automate = self.automate
+            if automate is None:
+                raise ValueError(f"L'état {self.nom} n'appartient à aucun automate")
+        elif self not in automate.etats:
+            raise ValueError(f"L'état {self.nom} n'appartient pas à l'automate")
+        return automate.index_graphe()
+
+    def est_accessible(self, automate=None) -> bool:
         """Vérifie si l'état est accessible depuis l'état initial."""
-        pass
+        return self._index(automate).est_accessible(self)
     
-    def est_utile(self) -> bool:
+    def est_utile(self, automate=None) -> bool:
         """Vérifie si l'état est utile (accessible et coaccessible)."""
-        pass
+        index = self._index(automate)
+        return index.est_accessible(self) and index.est_coaccessible(self)
     
-    def est_coaccessible(self) -> bool:
+    def est_coaccessible(self, automate=None) -> bool:
         """Vérifie si l'état est coaccessible (peut atteindre un état final)."""
-        pass
+        return self._index(automate).est_coaccessible(self)
     
-    def chemin_vers_initial(self) -> Optional[List[str]]:
-        """Retourne un chemin vers l'état initial s'il existe."""
-        pass
+    def chemin_vers_initial(self, automate=None) -> Optional[List[str]]:
+        """
+        Retourne un plus court chemin reliant l'état initial à cet état
+        (noms des états, de l'état initial à celui-ci) s'il existe.
+        """
+        chemin = self._index(automate).chemin_depuis_initial(self)
+        return [etat.nom for etat in chemin] if chemin is not None else None
     
-    def chemin_vers_final(self) -> Optional[List[str]]:
-        """Retourne un chemin vers un état final s'il existe."""
-        pass
+    def chemin_vers_final(self, automate=None) -> Optional[List[str]]:
+        """Retourne un plus court chemin (noms des états) vers un état final s'il existe."""
+        chemin = self._index(automate).chemin_vers_final(self)
+        return [etat.nom for etat in chemin] if chemin is not None else None
     
-    def etats_atteignables(self) -> Set[str]:
+    def etats_atteignables(self, automate=None) -> Set[str]:
         """Retourne l'ensemble des états atteignables depuis cet état."""
-        pass
+        return self._index(automate).etats_atteignables(self)
     
-    def etats_precedents(self) -> Set[str]:
+    def etats_precedents(self, automate=None) -> Set[str]:
         """Retourne l'ensemble des états qui peuvent atteindre cet état."""
-        pass
+        return self._index(automate).etats_precedents(self)
     
-    def est_emonde(self) -> bool:
+    def est_emonde(self, automate=None) -> bool:
         """Vérifie si l'état fait partie de l'automate émondé."""
-        pass
+        return self.est_utile(automate)
 
     """Surcharge d'operateur"""
     def __str__(self):
@@ -61,7 +174,7 @@ class Etat:
         return f"Etat('{self.nom}')"
     
     def __eq__(self, other):
-        return isinstance(other, Etat) and self.nom == other.nom
+        return isinstance(other, Etat) and self.id == other.id
     
     def __hash__(self):
-        return hash(self.nom)
+        return self.id
@@ -0,0 +1,224 @@
+from functools import lru_cache
+from typing import Set, List, Tuple, Optional, FrozenSet
+from Etat import Etat
+from Automate import AFNS, AFDC, EPSILON
+from TableTransitions import TableTransitions
+
+
+# Nombre de motifs compilés conservés en mémoire
+TAILLE_CACHE_REGEX = 1024
+
+
+class ExpressionReguliere:
+    """
+    Expression régulière et sa compilation en automate.
+
+    Syntaxe reconnue :
+    - union: a|b
+    - concaténation: ab
+    - étoile de Kleene, plus, option: a*, a+, a?
+    - groupement: (ab)*, () désigne le mot vide
+    - classes de caractères: [abc], [a-z], [^ab] (complément dans l'alphabet)
+    - point: . (n'importe quel symbole de l'alphabet)
+    - échappement: \\* désigne le symbole '*'
+
+    Arbre syntaxique (tuples):
+    ('vide',), ('symboles', frozenset), ('concat', [..]), ('union', [..]),
+    ('etoile', x), ('plus', x), ('option', x)
+    """
+
+    def __init__(self, motif: str, alphabet: Optional[Set[str]] = None) -> None:
+        """
+        Analyse une expression régulière.
+
+        Args:
+            motif: Expression régulière
+            alphabet: Alphabet de référence ; par défaut, les symboles du motif
+        """
+        self.motif = motif
+        self.alphabet = set(alphabet) if alphabet is not None else None
+        self._position = 0
+        self.arbre = self._analyser_union()
+        if self._position < len(motif):
+            raise ValueError(f"Caractère inattendu '{motif[self._position]}' "
+                             f"en position {self._position}")
+        if self.alphabet is None:
+            self.alphabet = self._symboles_utilises(self.arbre)
+
+    # ----- Analyse syntaxique (descente récursive) -----
+
+    def _courant(self) -> Optional[str]:
+        if self._position < len(self.motif):
+            return self.motif[self._position]
+        return None
+
+    def _lire(self) -> str:
+        caractere = self._courant()
+        if caractere is None:
+            raise ValueError(f"Fin inattendue de l'expression '{self.motif}'")
+        self._position += 1
+        return caractere
+
+    def _analyser_union(self) -> tuple:
+        branches = [self._analyser_concat()]
+        while self._courant() == "|":
+            self._position += 1
+            branches.append(self._analyser_concat())
+        return branches[0] if len(branches) == 1 else ("union", branches)
+
+    def _analyser_concat(self) -> tuple:
+        facteurs = []
+        while self._courant() is not None and self._courant() not in "|)":
+            facteurs.append(self._analyser_repetition())
+        if not facteurs:
+            return ("vide",)
+        return facteurs[0] if len(facteurs) == 1 else ("concat", facteurs)
+
+    def _analyser_repetition(self) -> tuple:
+        arbre = self._analyser_atome()
+        operateurs = {"*": "etoile", "+": "plus", "?": "option"}
+        while self._courant() in operateurs:
+            arbre = (operateurs[self._lire()], arbre)
+        return arbre
+
+    def _analyser_atome(self) -> tuple:
+        caractere = self._lire()
+        if caractere == "(":
+            arbre = self._analyser_union()
+            if self._courant() != ")":
+                raise ValueError(f"Parenthèse non fermée dans '{self.motif}'")
+            self._position += 1
+            return arbre
+        if caractere == "[":
+            return ("symboles", self._analyser_classe())
+        if caractere == ".":
+            return ("symboles", frozenset(self._alphabet_requis(".")))
+        if caractere == "\\":
+            return ("symboles", frozenset(self._symbole(self._lire())))
+        if caractere in "*+?)]":
+            raise ValueError(f"Caractère '{caractere}' inattendu en position {self._position - 1}")
+        return ("symboles", frozenset(self._symbole(caractere)))
+
+    def _analyser_classe(self) -> FrozenSet[str]:
+        negation = self._courant() == "^"
+        if negation:
+            self._position += 1
+
+        symboles = set()
+        while self._courant() != "]":
+            debut = self._lire()
+            if debut == "\\":
+                debut = self._lire()
+            if self._courant() == "-" and self.motif[self._position + 1:self._position + 2] not in ("", "]"):
+                self._position += 1
+                fin = self._lire()
+                if fin == "\\":
+                    fin = self._lire()
+                if ord(fin) < ord(debut):
+                    raise ValueError(f"Intervalle invalide [{debut}-{fin}]")
+                symboles.update(chr(code) for code in range(ord(debut), ord(fin) + 1))
+            else:
+                symboles.add(debut)
+        self._position += 1
+
+        if negation:
+            return frozenset(self._alphabet_requis("[^...]") - symboles)
+        if self.alphabet is not None:
+            symboles &= self.alphabet
+        return frozenset(symboles)
+
+    def _symbole(self, caractere: str) -> Set[str]:
+        if self.alphabet is not None and caractere not in self.alphabet:
+            raise ValueError(f"Le symbole '{caractere}' n'est pas dans l'alphabet")
+        return {caractere}
+
+    def _alphabet_requis(self, construction: str) -> Set[str]:
+        if self.alphabet is None:
+            raise ValueError(f"'{construction}' nécessite un alphabet explicite")
+        return self.alphabet
+
+    def _symboles_utilises(self, arbre: tuple) -> Set[str]:
+        symboles = set()
+        a_visiter = [arbre]
+        while a_visiter:
+            noeud = a_visiter.pop()
+            if noeud[0] == "symboles":
+                symboles |= noeud[1]
+            elif noeud[0] in ("concat", "union"):
+                a_visiter.extend(noeud[1])
+            elif noeud[0] != "vide":
+                a_visiter.append(noeud[1])
+        return symboles
+
+    # ----- Construction de Thompson -----
+
+    def vers_afns(self) -> AFNS:
+        """Construction de Thompson : un AFNS avec un seul état final."""
+        transitions: List[Tuple[int, str, int]] = []
+        compteur = [0]
+
+        def nouvel_etat() -> int:
+            compteur[0] += 1
+            return compteur[0] - 1
+
+        def construire(noeud: tuple) -> Tuple[int, int]:
+            debut, fin = nouvel_etat(), nouvel_etat()
+            nature = noeud[0]
+            if nature == "vide":
+                transitions.append((debut, EPSILON, fin))
+            elif nature == "symboles":
+                for symbole in noeud[1]:
+                    transitions.append((debut, symbole, fin))
+            elif nature == "concat":
+                precedent = debut
+                for facteur in noeud[1]:
+                    d, f = construire(facteur)
+                    transitions.append((precedent, EPSILON, d))
+                    precedent = f
+                transitions.append((precedent, EPSILON, fin))
+            elif nature == "union":
+                for branche in noeud[1]:
+                    d, f = construire(branche)
+                    transitions.append((debut, EPSILON, d))
+                    transitions.append((f, EPSILON, fin))
+            else:
+                d, f = construire(noeud[1])
+                transitions.append((debut, EPSILON, d))
+                transitions.append((f, EPSILON, fin))
+                if nature in ("etoile", "plus"):
+                    transitions.append((f, EPSILON, d))
+                if nature in ("etoile", "option"):
+                    transitions.append((debut, EPSILON, fin))
+            return debut, fin
+
+        debut, fin = construire(self.arbre)
+        etats = [Etat(f"t{i}") for i in range(compteur[0])]
+        afns = AFNS(set(self.alphabet), set(etats), etats[debut], {etats[fin]})
+        for source, symbole, cible in transitions:
+            afns.ajouter_transition(etats[source], symbole, etats[cible])
+        return afns
+
+    def vers_afdc(self) -> AFDC:
+        """Compile l'expression en AFDC minimal (Thompson, sous-ensembles, Hopcroft)."""
+        return self.vers_afns().construction_sous_ensembles().minimiser()
+
+    def __repr__(self) -> str:
+        return f"ExpressionReguliere('{self.motif}')"
+
+
+@lru_cache(maxsize=TAILLE_CACHE_REGEX)
+def _table_regex(motif: str, alphabet: Optional[FrozenSet[str]]) -> Tuple[TableTransitions, FrozenSet[str]]:
+    """Table compilée (figée) de l'AFDC minimal du motif, et son alphabet."""
+    afdc = ExpressionReguliere(motif, alphabet).vers_afdc()
+    return afdc.compiler(), frozenset(afdc.alphabet)
+
+
+def compiler_regex(motif: str, alphabet: Optional[FrozenSet[str]] = None) -> AFDC:
+    """
+    Compile une expression régulière en AFDC minimal. Seule la table de
+    transitions, immuable, est mémoïsée par (motif, alphabet) dans un cache
+    LRU borné : chaque appel retourne un automate neuf, modifiable sans
+    effet sur les appels suivants.
+    """
+    table, symboles = _table_regex(motif, alphabet)
+    return AFDC.depuis_table(table, symboles)
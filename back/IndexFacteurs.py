@@ -0,0 +1,150 @@
+from typing import Dict, List, Iterator, Optional
+
+
+class IndexFacteurs:
+    """
+    Automate des suffixes d'un mot (construction en ligne de Blumer et
+    al.), en temps et en espace linéaires : au plus 2n-1 états.
+
+    Chaque facteur du mot est lu par exactement un chemin depuis l'état 0 ;
+    les requêtes sur les facteurs se font donc sans les matérialiser.
+    Pour chaque état v :
+    - longueurs[v]: longueur du plus long facteur menant à v
+    - liens[v]: lien suffixe (-1 pour l'état initial)
+    - transitions[v]: dictionnaire symbole -> état
+    - fins[v]: position de fin de la première occurrence des facteurs de v
+    - occurrences[v]: nombre d'occurrences des facteurs de v
+    """
+
+    def __init__(self, texte: str) -> None:
+        """Construit l'index des facteurs de texte."""
+        self.texte = texte
+        longueurs = [0]
+        liens = [-1]
+        transitions: List[Dict[str, int]] = [{}]
+        fins = [-1]
+        occurrences = [0]
+        dernier = 0
+
+        for position, symbole in enumerate(texte):
+            courant = len(longueurs)
+            longueurs.append(longueurs[dernier] + 1)
+            liens.append(0)
+            transitions.append({})
+            fins.append(position)
+            occurrences.append(1)
+
+            p = dernier
+            while p != -1 and symbole not in transitions[p]:
+                transitions[p][symbole] = courant
+                p = liens[p]
+            if p != -1:
+                q = transitions[p][symbole]
+                if longueurs[p] + 1 == longueurs[q]:
+                    liens[courant] = q
+                else:
+                    # Clonage de q pour séparer les facteurs plus courts
+                    clone = len(longueurs)
+                    longueurs.append(longueurs[p] + 1)
+                    liens.append(liens[q])
+                    transitions.append(dict(transitions[q]))
+                    fins.append(fins[q])
+                    occurrences.append(0)
+                    while p != -1 and transitions[p].get(symbole) == q:
+                        transitions[p][symbole] = clone
+                        p = liens[p]
+                    liens[q] = clone
+                    liens[courant] = clone
+            dernier = courant
+
+        # Nombre d'occurrences : propagation le long des liens suffixes,
+        # des états les plus longs vers les plus courts (tri par dénombrement)
+        n = len(texte)
+        par_longueur = [0] * (n + 1)
+        for longueur in longueurs:
+            par_longueur[longueur] += 1
+        for i in range(n):
+            par_longueur[i + 1] += par_longueur[i]
+        ordre = [0] * len(longueurs)
+        for v in range(len(longueurs) - 1, -1, -1):
+            par_longueur[longueurs[v]] -= 1
+            ordre[par_longueur[longueurs[v]]] = v
+        for v in reversed(ordre):
+            if liens[v] > 0:
+                occurrences[liens[v]] += occurrences[v]
+
+        self.longueurs = longueurs
+        self.liens = liens
+        self.transitions = transitions
+        self.fins = fins
+        self.occurrences = occurrences
+
+    def _etat(self, facteur) -> Optional[int]:
+        """État atteint en lisant le facteur depuis l'état initial, ou None."""
+        v = 0
+        transitions = self.transitions
+        for symbole in facteur:
+            v = transitions[v].get(symbole)
+            if v is None:
+                return None
+        return v
+
+    def contient(self, facteur) -> bool:
+        """Vérifie si facteur est un facteur du mot, en O(|facteur|)."""
+        return self._etat(facteur) is not None
+
+    def nombre_occurrences(self, facteur) -> int:
+        """Nombre d'occurrences (éventuellement chevauchantes) du facteur."""
+        v = self._etat(facteur)
+        if v is None:
+            return 0
+        return self.occurrences[v] if v else len(self.texte) + 1
+
+    def premiere_occurrence(self, facteur) -> int:
+        """Position de début de la première occurrence du facteur, ou -1."""
+        v = self._etat(facteur)
+        if v is None:
+            return -1
+        return self.fins[v] - len(facteur) + 1
+
+    def nombre_facteurs_distincts(self) -> int:
+        """Nombre de facteurs distincts, mot vide compris."""
+        longueurs = self.longueurs
+        liens = self.liens
+        return 1 + sum(longueurs[v] - longueurs[liens[v]] for v in range(1, len(longueurs)))
+
+    def facteurs(self) -> Iterator[str]:
+        """
+        Énumère paresseusement les facteurs distincts, mot vide compris,
+        dans l'ordre lexicographique (parcours en profondeur de l'automate).
+        """
+        texte = self.texte
+        yield ""
+        pile = [(0, 0, iter(sorted(self.transitions[0].items())))]
+        while pile:
+            _, longueur, suivants = pile[-1]
+            transition = next(suivants, None)
+            if transition is None:
+                pile.pop()
+                continue
+            w = transition[1]
+            fin = self.fins[w]
+            yield texte[fin - longueur:fin + 1]
+            pile.append((w, longueur + 1, iter(sorted(self.transitions[w].items()))))
+
+    def plus_long_facteur_repete(self) -> str:
+        """Plus long facteur ayant au moins deux occurrences (chevauchantes ou non)."""
+        meilleur = 0
+        for v in range(1, len(self.longueurs)):
+            if self.occurrences[v] >= 2 and self.longueurs[v] > self.longueurs[meilleur]:
+                meilleur = v
+        if meilleur == 0:
+            return ""
+        fin = self.fins[meilleur]
+        return self.texte[fin - self.longueurs[meilleur] + 1:fin + 1]
+
+    def __len__(self) -> int:
+        return len(self.longueurs)
+
+    def __repr__(self) -> str:
+        return f"IndexFacteurs({len(self.texte)} symboles, {len(self.longueurs)} états)"
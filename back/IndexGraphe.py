@@ -0,0 +1,222 @@
+from typing import Set, Dict, List, Tuple, Optional
+
+
+def composantes_fortement_connexes(voisins: List[List[int]]) -> Tuple[List[int], List[List[int]]]:
+    """
+    Algorithme de Tarjan (version itérative, sans limite de récursion).
+
+    Args:
+        voisins: Listes d'adjacence sur les sommets 0..n-1
+
+    Returns:
+        (composante, composantes) où composante[v] est l'indice de la
+        composante de v ; les composantes sont produites dans l'ordre
+        topologique inverse (une composante apparaît après toutes celles
+        qu'elle atteint)
+    """
+    n = len(voisins)
+    numero = [-1] * n
+    bas = [0] * n
+    sur_pile = bytearray(n)
+    pile = []
+    composante = [-1] * n
+    composantes = []
+    compteur = 0
+
+    for racine in range(n):
+        if numero[racine] >= 0:
+            continue
+        numero[racine] = bas[racine] = compteur
+        compteur += 1
+        pile.append(racine)
+        sur_pile[racine] = 1
+        appels = [(racine, 0)]
+
+        while appels:
+            v, k = appels[-1]
+            if k < len(voisins[v]):
+                appels[-1] = (v, k + 1)
+                w = voisins[v][k]
+                if numero[w] < 0:
+                    numero[w] = bas[w] = compteur
+                    compteur += 1
+                    pile.append(w)
+                    sur_pile[w] = 1
+                    appels.append((w, 0))
+                elif sur_pile[w] and numero[w] < bas[v]:
+                    bas[v] = numero[w]
+                continue
+
+            appels.pop()
+            if appels:
+                u = appels[-1][0]
+                if bas[v] < bas[u]:
+                    bas[u] = bas[v]
+            if bas[v] == numero[v]:
+                c = len(composantes)
+                membres = []
+                while True:
+                    w = pile.pop()
+                    sur_pile[w] = 0
+                    composante[w] = c
+                    membres.append(w)
+                    if w == v:
+                        break
+                composantes.append(membres)
+
+    return composante, composantes
+
+
+def _parcours_largeur(departs: List[int], voisins: List[List[int]]) -> List[int]:
+    """Parcours en largeur ; retourne l'arbre des parents (-1 racine, -2 non atteint)."""
+    parents = [-2] * len(voisins)
+    for depart in departs:
+        parents[depart] = -1
+    file = list(departs)
+    for v in file:
+        for w in voisins[v]:
+            if parents[w] == -2:
+                parents[w] = v
+                file.append(w)
+    return parents
+
+
+class IndexGraphe:
+    """
+    Index du graphe sous-jacent d'un automate (tous symboles confondus,
+    ε compris), calculés une fois en temps linéaire et partagés par toutes
+    les requêtes sur les états :
+    - adjacences directe et inverse
+    - arbre de parcours en largeur depuis l'état initial (accessibilité)
+    - arbre de parcours en largeur inverse depuis les états finaux (coaccessibilité)
+    - composantes fortement connexes (calculées à la demande), dont les
+      ensembles d'états atteignables sont mémorisés
+    """
+
+    def __init__(self, automate) -> None:
+        """Construit les index depuis les transitions de l'automate."""
+        self.etats = automate._ordre_etats()
+        self.index = {etat: i for i, etat in enumerate(self.etats)}
+        n = len(self.etats)
+
+        successeurs = [set() for _ in range(n)]
+        for source, sorties in automate.transitions.items():
+            i = self.index[source]
+            for destinations in sorties.values():
+                for destination in destinations:
+                    successeurs[i].add(self.index[destination])
+        self.successeurs = [list(voisins) for voisins in successeurs]
+        self.predecesseurs = [[] for _ in range(n)]
+        for i, voisins in enumerate(self.successeurs):
+            for j in voisins:
+                self.predecesseurs[j].append(i)
+
+        self.parents_acces = _parcours_largeur([0], self.successeurs)
+        finaux = [self.index[etat] for etat in automate.etats_finaux if etat in self.index]
+        self.suivants_coacces = _parcours_largeur(finaux, self.predecesseurs)
+
+        self._condensation = None
+
+    def condensation(self) -> tuple:
+        """
+        Graphe condensé (composantes fortement connexes), calculé à la
+        première requête qui en a besoin.
+
+        Returns:
+            (composante, masques, successeurs, predecesseurs, descendants, ancetres)
+            sur les composantes ; les deux derniers sont des mémos à la demande
+        """
+        if self._condensation is not None:
+            return self._condensation
+
+        composante, composantes = composantes_fortement_connexes(self.successeurs)
+        masques = []
+        successeurs_composantes = []
+        predecesseurs_composantes = [set() for _ in composantes]
+        for c, membres in enumerate(composantes):
+            masque = 0
+            voisines = set()
+            for v in membres:
+                masque |= 1 << v
+                for w in self.successeurs[v]:
+                    if composante[w] != c:
+                        voisines.add(composante[w])
+            masques.append(masque)
+            successeurs_composantes.append(list(voisines))
+            for d in voisines:
+                predecesseurs_composantes[d].add(c)
+        predecesseurs_composantes = [list(voisines) for voisines in predecesseurs_composantes]
+
+        self._condensation = (composante, masques, successeurs_composantes,
+                              predecesseurs_composantes, {}, {})
+        return self._condensation
+
+    def est_accessible(self, etat) -> bool:
+        return self.parents_acces[self.index[etat]] != -2
+
+    def est_coaccessible(self, etat) -> bool:
+        return self.suivants_coacces[self.index[etat]] != -2
+
+    def chemin_depuis_initial(self, etat) -> Optional[List]:
+        """Plus court chemin (liste d'états) de l'état initial jusqu'à l'état."""
+        v = self.index[etat]
+        if self.parents_acces[v] == -2:
+            return None
+        chemin = []
+        while v != -1:
+            chemin.append(self.etats[v])
+            v = self.parents_acces[v]
+        return chemin[::-1]
+
+    def chemin_vers_final(self, etat) -> Optional[List]:
+        """Plus court chemin (liste d'états) de l'état jusqu'à un état final."""
+        v = self.index[etat]
+        if self.suivants_coacces[v] == -2:
+            return None
+        chemin = []
+        while v != -1:
+            chemin.append(self.etats[v])
+            v = self.suivants_coacces[v]
+        return chemin
+
+    def _fermeture_composante(self, c: int, masques: List[int],
+                              voisines: List[List[int]], memo: Dict[int, int]) -> int:
+        """Union des états des composantes atteignables depuis c dans le graphe condensé."""
+        pile = [c]
+        while pile:
+            x = pile[-1]
+            if x in memo:
+                pile.pop()
+                continue
+            manquantes = [y for y in voisines[x] if y not in memo]
+            if manquantes:
+                pile.extend(manquantes)
+                continue
+            masque = masques[x]
+            for y in voisines[x]:
+                masque |= memo[y]
+            memo[x] = masque
+            pile.pop()
+        return memo[c]
+
+    def _etats_du_masque(self, masque: int) -> Set:
+        etats = set()
+        while masque:
+            bas = masque & -masque
+            etats.add(self.etats[bas.bit_length() - 1])
+            masque ^= bas
+        return etats
+
+    def etats_atteignables(self, etat) -> Set:
+        """États atteignables depuis l'état (lui compris)."""
+        composante, masques, successeurs, _, descendants, _ = self.condensation()
+        c = composante[self.index[etat]]
+        return self._etats_du_masque(
+            self._fermeture_composante(c, masques, successeurs, descendants))
+
+    def etats_precedents(self, etat) -> Set:
+        """États depuis lesquels l'état est atteignable (lui compris)."""
+        composante, masques, _, predecesseurs, _, ancetres = self.condensation()
+        c = composante[self.index[etat]]
+        return self._etats_du_masque(
+            self._fermeture_composante(c, masques, predecesseurs, ancetres))
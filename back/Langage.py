@@ -1,37 +1,110 @@
 
-from typing import Set, Dict, List, Tuple, Optional, Union, Any
-from Mot import Mot
+from typing import Set, Dict, List, Tuple, Optional, Union, Any, Iterable
+from Mot import Mot, alphabet_partage
+from Trie import Trie
 
 class Langage:
     """
     Classe représentant un langage (ensemble de mots).
     Surcharge d'opérateurs pour les opérations sur les langages.
+
+    Deux stockages des mots :
+    - "ensemble" (par défaut): un set de Mot
+    - "trie": un arbre des préfixes (compactable en DAWG) ; les requêtes
+      par préfixe et par longueur et les opérations ensemblistes entre
+      langages ainsi stockés sont structurelles. Aucun ensemble de Mot
+      n'est conservé à côté du trie : l'attribut mots en construit une
+      copie à chaque lecture, et les ajouts passent par ajouter_mot.
     """
     
-    def __init__(self, mots: Optional[Set[Mot]] = None, 
+    def __init__(self, mots: Optional[Union[Set[Mot], Trie]] = None, 
                  alphabet: Optional[Set[str]] = None, 
                  est_infini : bool = True,
-                valeur_max : int = 1_000_000) -> None:
+                valeur_max : int = 1_000_000,
+                stockage: str = "ensemble") -> None:
         """
         Initialise un langage.
         
         Args:
-            mots: Ensemble de mots du langage
+            mots: Ensemble de mots du langage (ou Trie de chaînes pour le stockage "trie")
             alphabet: Alphabet du langage
+            stockage: "ensemble" ou "trie"
         """
-        self.mots = set(mots) if mots is not None else set()
+        if stockage not in ("ensemble", "trie"):
+            raise ValueError(f"Stockage inconnu : {stockage}")
+        self.stockage = stockage
+        self._trie = None
+        self._mots = None
         self.alphabet = set(alphabet) if alphabet is not None else set()
         self.langage_fini = est_infini
         self.valeur_max = valeur_max
 
-        if alphabet is None and mots:
-            self.alphabet = self._calculer_alphabet_depuis_mots()
+        if stockage == "trie":
+            if isinstance(mots, Trie):
+                self._trie = mots
+                if alphabet is None:
+                    self.alphabet = self._calculer_alphabet_depuis_trie()
+            else:
+                self._trie = Trie()
+                for mot in mots or ():
+                    self._trie.ajouter(mot.contenu)
+                    if alphabet is None:
+                        self.alphabet.update(mot.alphabet_set)
+        else:
+            self._mots = set(mots) if mots is not None else set()
+            if alphabet is None and mots:
+                self.alphabet = self._calculer_alphabet_depuis_mots()
+
+    @property
+    def mots(self) -> Set[Mot]:
+        """
+        Ensemble des mots ; pour le stockage "trie", frozenset construit à
+        chaque lecture (une modification lèverait une erreur au lieu d'être
+        perdue : passer par ajouter_mot).
+        """
+        if self._trie is not None:
+            return frozenset(self._mot(contenu) for contenu in self._trie)
+        return self._mots
+
+    @mots.setter
+    def mots(self, mots: Set[Mot]) -> None:
+        if self._trie is not None:
+            self._trie = Trie(mot.contenu for mot in mots)
+        else:
+            self._mots = mots
+
+    def _mot(self, contenu: str) -> Mot:
+        """Mot du langage (sur son alphabet), sans revalidation."""
+        return Mot._creer(contenu, alphabet_partage(self.alphabet))
+
+    def _calculer_alphabet_depuis_trie(self) -> Set[str]:
+        """Symboles étiquetant les arcs du trie."""
+        alphabet = set()
+        vus = {self._trie.racine}
+        pile = [self._trie.racine]
+        while pile:
+            for symbole, enfant in self._trie.enfants(pile.pop()):
+                alphabet.add(symbole)
+                if enfant not in vus:
+                    vus.add(enfant)
+                    pile.append(enfant)
+        return alphabet
+
+    def _avec_trie(self, *autres: 'Langage') -> bool:
+        return self._trie is not None and all(autre._trie is not None for autre in autres)
+
+    def compacter(self) -> 'Langage':
+        """Compacte le trie en DAWG (suffixes partagés) ; le langage devient non modifiable."""
+        if self._trie is None:
+            raise ValueError("Seul le stockage \"trie\" se compacte")
+        self._trie.compacter()
+        return self
     
     def _calculer_alphabet_depuis_mots(self) -> Set[str]:
         """Calcule l'alphabet à partir des mots du langage."""
         alphabet = set()
-        for mot in self.mots:
-            alphabet.update(mot.alphabet)  # Union des alphabets
+        for mot in self._mots:
+            alphabet.update(mot.alphabet_set)  # Union des alphabets
         return alphabet
     
     
@@ -39,21 +112,34 @@ class Langage:
         """Retourne la taille du langage (peut être infinie)."""
         if not self.langage_fini:
             return float('inf')
-        return len(self.mots)
+        return len(self)
     
     def ajouter_mot(self, mot: Mot) -> None:
         """Ajoute un mot au langage."""
         
-        if not self.alphabet.issubset(mot.alphabet) and self.alphabet:
+        if not self.alphabet.issubset(mot.alphabet_set) and self.alphabet:
             raise ValueError(f"Le mot {mot} n'est pas sur l'alphabet {self.alphabet}")
-        self.mots.add(mot) 
+        if self._trie is not None:
+            self._trie.ajouter(mot.contenu)
+        else:
+            self._mots.add(mot)
 
     def reunion_finie_des_langages(self, autres_langages: List['Langage']) -> 'Langage':
         """Réunion finie de langages."""
         if not self.langage_fini:
             raise TypeError("Le langage est infini, impossible de faire la réunion")
+
+        if self._avec_trie(*autres_langages):
+            trie = self._trie
+            for langage in autres_langages:
+                if not langage.langage_fini:
+                    raise TypeError("Un des langages est infini")
+                if self.alphabet != langage.alphabet:
+                    raise ValueError(f"Attention: alphabets différents {self.alphabet} vs {langage.alphabet}")
+                trie = trie.union(langage._trie)
+            return Langage(trie, self.alphabet.copy(), stockage="trie")
         
-        nouveaux_mots = self.mots.copy()
+        nouveaux_mots = set(self)
         nouvel_alphabet = self.alphabet.copy()
         
         for langage in autres_langages:
@@ -63,13 +149,15 @@ class Langage:
             if self.alphabet != langage.alphabet:
                 raise ValueError(f"Attention: alphabets différents {self.alphabet} vs {langage.alphabet}")
             
-            nouveaux_mots.update(langage.mots)
+            nouveaux_mots.update(langage)
         
         return Langage(nouveaux_mots, nouvel_alphabet)
 
     def contient_mot(self, mot: Mot) -> bool:
         """Appartenance d'un mot a un langage langages."""
-        return mot in self.mots  
+        if self._trie is not None:
+            return getattr(mot, "contenu", mot) in self._trie
+        return mot in self._mots
     
     def concatenation_des_langages(self, autre_langage: 'Langage') -> 'Langage':
         """Concaténation de deux langages."""
@@ -77,15 +165,22 @@ class Langage:
         if self.alphabet != autre_langage.alphabet:
             raise ValueError("The alphabets for both languages are different")
     
-        if len(self.mots) == 0 or len(autre_langage.mots) == 0:
+        if self._trie is not None:
+            # Concaténation des contenus, rangée directement dans un trie
+            droite = list(autre_langage._contenus())
+            return Langage(Trie(gauche + contenu for gauche in self._trie for contenu in droite),
+                           self.alphabet, stockage="trie")
+
+        if len(self) == 0 or len(autre_langage) == 0:
             return Langage({}, self.alphabet)
         
          
         # Utilisation d'un set pour éviter les doublons automatiquement
         mots_concatenes = set()
+        droite = list(autre_langage)
         
-        for mot1 in self.mots:
-            for mot2 in autre_langage.mots:
+        for mot1 in self._mots:
+            for mot2 in droite:
                 mot_concatene = mot1 + mot2
                 mots_concatenes.add(mot_concatene)
         
@@ -102,9 +197,9 @@ class Langage:
             return Langage({mot_vide}, self.alphabet)
         
         if n == 1:
-            return Langage(self.mots.copy(), self.alphabet.copy())
+            return self._depuis_contenus(self._contenus())
                
-        resultat = Langage(self.mots.copy(), self.alphabet.copy())
+        resultat = self._depuis_contenus(self._contenus())
         for i in range(1, n):
             resultat = resultat.concatenation_des_langages(self)
         
@@ -114,29 +209,117 @@ class Langage:
         """Étoile de Kleene du langage."""
         return self.kleene_tronquee(self.valeur_max)
     
+    def index_trie(self) -> Trie:
+        """Trie des mots : celui du stockage "trie", ou construit à la demande."""
+        if self._trie is not None:
+            return self._trie
+        return Trie(mot.contenu for mot in self._mots)
+
+    def _contenus(self) -> Iterable[str]:
+        """Contenus (chaînes) des mots, sans construire d'objets Mot."""
+        if self._trie is not None:
+            return iter(self._trie)
+        return (mot.contenu for mot in self._mots)
+
+    def _depuis_contenus(self, contenus: Iterable[str]) -> 'Langage':
+        """Langage de mêmes alphabet et stockage, depuis des chaînes."""
+        if self._trie is not None:
+            return Langage(Trie(contenus), self.alphabet.copy(), stockage="trie")
+        return Langage({self._mot(contenu) for contenu in contenus}, self.alphabet.copy())
+
+    @staticmethod
+    def _lecteur_diviseur(diviseur, a_rebours: bool = False) -> Tuple[Any, callable, callable]:
+        """
+        Lecture symbole par symbole d'un diviseur : un langage, indexé en
+        trie (trie des miroirs pour une lecture à rebours), ou un automate,
+        lu par produits vecteur-matrice sur ses matrices booléennes.
+
+        Returns:
+            (curseur de départ ou None, avancer(curseur, symbole) -> curseur ou None,
+            est_final(curseur))
+        """
+        if isinstance(diviseur, Langage):
+            if a_rebours:
+                trie = Trie(contenu[::-1] for contenu in diviseur._contenus())
+            else:
+                trie = diviseur.index_trie()
+            return trie.racine, trie.enfant, trie.est_final
+
+        initial, lettres, finaux = diviseur._matrices_lettres()
+        if a_rebours:
+            # Curseur : états depuis lesquels la fin du mot déjà lue mène à un état final
+            lettres = {symbole: matrice.transposee() for symbole, matrice in lettres.items()}
+            initial, finaux = finaux, initial
+
+        def avancer(vecteur: int, symbole: str) -> Optional[int]:
+            matrice = lettres.get(symbole)
+            if matrice is None:
+                return None
+            return matrice.produit_vecteur(vecteur) or None
+
+        return initial or None, avancer, lambda vecteur: bool(vecteur & finaux)
+
     def quotient_gauche_de_langages(self, autre_langage: 'Langage') -> 'Langage':
         """Quotient de langages."""
-        """L1^-1.L2"""
-        L2 = set()
-        for mot in self.mots:
-            for autre_mot in autre_langage.mots:
-                """ Verifier que le debut de mot est bien un mot de autre langage """
-                if mot.contenu.startswith(autre_mot.contenu):
-                   suffixe = mot.contenu[len(autre_mot.contenu):]
-                   L2.add(suffixe)
-        return Langage(L2)
+        """
+        K⁻¹.L = {s : u.s ∈ L, u ∈ K} où L est ce langage et K = autre_langage
+        (un Langage, ou un automate). Le diviseur est indexé une fois (trie
+        ou matrices) et chaque mot de L n'est lu qu'une fois ; pour un L en
+        trie, le parcours est simultané et chaque sous-arbre atteint par un
+        mot de K est recopié tel quel.
+        """
+        depart, avancer, est_final = self._lecteur_diviseur(autre_langage)
+        suffixes = set()
+        if depart is None:
+            return self._depuis_contenus(suffixes)
+
+        if self._trie is not None:
+            pile = [(self._trie.racine, depart)]
+            while pile:
+                noeud, curseur = pile.pop()
+                if est_final(curseur):
+                    suffixes.update(self._trie.mots_depuis(noeud, ""))
+                for symbole, enfant in self._trie.enfants(noeud):
+                    suivant = avancer(curseur, symbole)
+                    if suivant is not None:
+                        pile.append((enfant, suivant))
+            return self._depuis_contenus(suffixes)
+
+        for contenu in self._contenus():
+            curseur = depart
+            if est_final(curseur):
+                suffixes.add(contenu)
+            for i, symbole in enumerate(contenu):
+                curseur = avancer(curseur, symbole)
+                if curseur is None:
+                    break
+                if est_final(curseur):
+                    suffixes.add(contenu[i + 1:])
+        return self._depuis_contenus(suffixes)
     
     def quotient_droit_de_langages(self, autre_langage: 'Langage') -> 'Langage':
         """Quotient de langages."""
-        """L2.L1^-1"""
-        L2 = set()
-        for mot in self.mots:
-            for autre_mot in autre_langage.mots:
-                """ Verifier que la fin de mot est bien un mot de autre langage """
-                if mot.contenu.endswith(autre_mot.contenu):
-                    prefixe = mot.contenu[:-len(autre_mot.contenu)]
-                    L2.add(prefixe)
-        return Langage(L2)
+        """
+        L.K⁻¹ = {p : p.u ∈ L, u ∈ K} où L est ce langage et K = autre_langage
+        (un Langage, ou un automate). Chaque mot de L est lu une fois, à
+        rebours, dans le trie des miroirs de K (ou à rebours dans l'automate).
+        """
+        depart, avancer, est_final = self._lecteur_diviseur(autre_langage, a_rebours=True)
+        prefixes = set()
+        if depart is None:
+            return self._depuis_contenus(prefixes)
+
+        for contenu in self._contenus():
+            curseur = depart
+            if est_final(curseur):
+                prefixes.add(contenu)
+            for i in range(len(contenu) - 1, -1, -1):
+                curseur = avancer(curseur, contenu[i])
+                if curseur is None:
+                    break
+                if est_final(curseur):
+                    prefixes.add(contenu[:i])
+        return self._depuis_contenus(prefixes)
 
 
     def kleene_tronquee(self, max_longueur):
@@ -154,7 +337,7 @@ class Langage:
             puissance_courante = puissance_courante.concatenation_des_langages(self)
             
             # Filtrer par longueur pour éviter l'explosion
-            mots_filtres = {mot for mot in puissance_courante.mots if len(mot.contenu) <= max_longueur}
+            mots_filtres = {mot for mot in puissance_courante if len(mot.contenu) <= max_longueur}
             puissance_courante = Langage(mots_filtres, self.alphabet)
             resultat = resultat.reunion_finie_des_langages([puissance_courante])
         
@@ -162,22 +345,38 @@ class Langage:
     
     def est_vide(self) -> bool:
         """Vérifie si le langage est vide."""
-        return len(self.mots) == 0
+        return len(self) == 0
     
     def est_sous_langage_de(self, autre_langage: 'Langage') -> bool:
         """Vérifie si ce langage est un sous-langage d'un autre."""
+        if autre_langage._trie is not None:
+            return all(contenu in autre_langage._trie for contenu in self._contenus())
+        if self._trie is not None:
+            contenus = set(autre_langage._contenus())
+            return all(contenu in contenus for contenu in self._trie)
         # Utilisation de issubset() pour les sets - TRÈS EFFICACE !
-        return self.mots.issubset(autre_langage.mots)
+        return self._mots.issubset(autre_langage._mots)
     
     def mots_de_longueur(self, longueur: int) -> Set[Mot]:
         """Retourne tous les mots de longueur donnée."""
-        return {mot for mot in self.mots if len(mot.contenu) == longueur}
+        if self._trie is not None:
+            return {self._mot(contenu) for contenu in self._trie.mots_de_longueur(longueur)}
+        return {mot for mot in self._mots if len(mot.contenu) == longueur}
+
+    def mots_de_prefixe(self, prefixe: Union[Mot, str]) -> Set[Mot]:
+        """Retourne les mots commençant par le préfixe donné."""
+        prefixe = getattr(prefixe, "contenu", prefixe)
+        if self._trie is not None:
+            return {self._mot(contenu) for contenu in self._trie.mots_de_prefixe(prefixe)}
+        return {mot for mot in self._mots if mot.contenu.startswith(prefixe)}
     
     def longueur_maximale(self) -> int:
         """Retourne la longueur du mot le plus long."""
-        if not self.mots:
+        if self._trie is not None:
+            return self._trie.longueur_maximale()
+        if not self._mots:
             return 0
-        return max(len(mot.contenu) for mot in self.mots)
+        return max(len(mot.contenu) for mot in self._mots)
 
     # C'est approximatif ca, on ne peut pas se prononcer 
     def type_de_langage(self) -> str:
@@ -185,14 +384,14 @@ class Langage:
         if not self.langage_fini:
             return "Type indéterminé (langage infini)"
         
-        if len(self.mots) == 0:
+        if len(self) == 0:
             return "Langage vide"
         
-        if len(self.mots) == 1 and list(self.mots)[0].contenu == "":
+        if len(self) == 1 and next(iter(self._contenus())) == "":
             return "Langage {ε}"
         
         # Analyse basique - peut être étendue
-        longueurs = [len(mot.contenu) for mot in self.mots]
+        longueurs = [len(contenu) for contenu in self._contenus()]
         
         if all(l == longueurs[0] for l in longueurs):
             return f"Langage de mots de longueur {longueurs[0]}"
@@ -201,11 +400,15 @@ class Langage:
         
 
     def difference_langages(self, autre):
-        nouveaux_mots = self.mots - autre.mots
+        if self._avec_trie(autre):
+            return Langage(self._trie.difference(autre._trie), self.alphabet, stockage="trie")
+        nouveaux_mots = {mot for mot in self if mot not in autre}
         return Langage(nouveaux_mots, self.alphabet)
 
     def intersection_langages(self, autre):
-        mots_communs = self.mots & autre.mots
+        if self._avec_trie(autre):
+            return Langage(self._trie.intersection(autre._trie), self.alphabet, stockage="trie")
+        mots_communs = {mot for mot in self if mot in autre}
         return Langage(mots_communs, self.alphabet)
     
     # ===== SURCHARGES D'OPÉRATEURS OPTIMISÉES =====
@@ -232,19 +435,30 @@ class Langage:
     
     def __len__(self) -> int:
         """Retourne la taille du langage."""
-        return len(self.mots)
+        if self._trie is not None:
+            return len(self._trie)
+        return len(self._mots)
     
     def __iter__(self):
         """Permet l'itération sur les mots du langage."""
-        return iter(self.mots)
+        if self._trie is not None:
+            return (self._mot(contenu) for contenu in self._trie)
+        return iter(self._mots)
     
     def __contains__(self, mot: Mot) -> bool:
         """Surcharge de 'in' pour vérifier l'appartenance."""
-        return mot in self.mots
+        return self.contient_mot(mot)
     
     def __eq__(self, autre: 'Langage') -> bool:
         """Égalité entre langages."""
-        return (self.mots == autre.mots and 
+        if self._trie is not None or autre._trie is not None:
+            # Comparaison des contenus, sans construire d'ensemble de Mot
+            if self.alphabet != autre.alphabet or len(self) != len(autre):
+                return False
+            if self._avec_trie(autre):
+                return all(a == b for a, b in zip(self._trie, autre._trie))
+            return set(self._contenus()) == set(autre._contenus())
+        return (self._mots == autre._mots and 
                 self.alphabet == autre.alphabet)
     
     def __str__(self) -> str:
@@ -252,14 +466,14 @@ class Langage:
         if not self.langage_fini:
             return f"Langage infini sur alphabet {self.alphabet}"
         
-        if len(self.mots) == 0:
+        if len(self) == 0:
             return "(langage vide)"
         
-        mots_str = ", ".join(str(mot) for mot in sorted(self.mots, key=lambda m: m.contenu))
+        mots_str = ", ".join(str(mot) for mot in sorted(self, key=lambda m: m.contenu))
         return f"{{{mots_str}}}"
     
     def __repr__(self) -> str:
-        return f"Langage({self.mots}, {self.alphabet})"
+        return f"Langage({set(self)}, {self.alphabet})"
 
 
 
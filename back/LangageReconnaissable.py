@@ -2,7 +2,8 @@
 from typing import Set, Dict, List, Tuple, Optional, Union, Any
 from Mot import Mot
 from Langage import Langage
-from Automate import Automate
+from Automate import Automate, AFDC, construire_produit
+from ExpressionReguliere import compiler_regex
 
 
 class LangageReconnaissable(Langage):
@@ -14,20 +15,112 @@ class LangageReconnaissable(Langage):
     def __init__(self, mots: Optional[Set[Mot]] = None, alphabet: Optional[Set[str]] = None,
                  automate: Optional[Automate] = None) -> None:
         """Initialise un langage reconnaissable."""
-        super.__init__(self, mots, alphabet)
+        super().__init__(mots, alphabet)
+        self.automate = automate
+
+    def contient_mot(self, mot: Mot) -> bool:
+        """Appartenance d'un mot, décidée par l'automate s'il est connu."""
+        if self.automate is not None:
+            return self.automate.reconnaitre_mot(mot)
+        return super().contient_mot(mot)
+
+    def __contains__(self, mot: Mot) -> bool:
+        return self.contient_mot(mot)
 
     
     def complementation(self) -> 'LangageReconnaissable':
-        """Clôture par complémentation."""
-        pass
+        """
+        Clôture par complémentation (sur l'alphabet du langage) ; un langage
+        donné par ses mots est complémenté sur l'automate de son trie.
+        """
+        return LangageReconnaissable(set(), self.alphabet,
+                                     self._afdc().complementaire(self.alphabet))
+
+    def _afdc(self) -> AFDC:
+        """Automate du langage (celui de ses mots s'il n'en a pas), déterminisé au besoin."""
+        automate = self._automate_de(self)
+        if not isinstance(automate, AFDC):
+            automate, _ = construire_produit([automate], lambda finaux: finaux[0])
+        return automate
+
+    @staticmethod
+    def _automate_connu(langage: Langage) -> Optional[Automate]:
+        """Automate d'un langage s'il en a un (None pour un langage donné par ses mots)."""
+        return langage.automate if isinstance(langage, LangageReconnaissable) else None
+
+    @classmethod
+    def _automate_de(cls, langage: Langage) -> Automate:
+        """Automate d'un langage : le sien, ou celui de ses mots (langage fini, via son trie)."""
+        automate = cls._automate_connu(langage)
+        if automate is not None:
+            return automate
+        return AFDC.depuis_trie(langage.index_trie(), langage.alphabet)
+
+    @classmethod
+    def _diviseur(cls, autre: Langage) -> Union[Langage, Automate]:
+        """Automate du diviseur s'il en a un, sinon ses mots."""
+        automate = cls._automate_connu(autre)
+        return automate if automate is not None else autre
+
+    def _depuis_contenus(self, contenus: Set[str]) -> 'LangageReconnaissable':
+        """Langage reconnaissable fini (sans automate) de même alphabet, depuis des chaînes."""
+        return LangageReconnaissable({self._mot(contenu) for contenu in contenus}, self.alphabet.copy())
+
+    def quotient_gauche_de_langages(self, autre_langage: Langage) -> 'LangageReconnaissable':
+        """Quotient gauche, calculé sur l'automate du langage s'il en a un (AFDC.quotient_gauche)."""
+        if self.automate is None:
+            return super().quotient_gauche_de_langages(self._diviseur(autre_langage))
+        return LangageReconnaissable(set(), self.alphabet,
+                                     self._afdc().quotient_gauche(self._diviseur(autre_langage)))
+
+    def quotient_droit_de_langages(self, autre_langage: Langage) -> 'LangageReconnaissable':
+        """Quotient droit, calculé sur l'automate du langage s'il en a un (AFDC.quotient_droit)."""
+        if self.automate is None:
+            return super().quotient_droit_de_langages(self._diviseur(autre_langage))
+        return LangageReconnaissable(set(), self.alphabet,
+                                     self._afdc().quotient_droit(self._diviseur(autre_langage)))
     
     def union_ensembliste(self, autre: 'LangageReconnaissable') -> 'LangageReconnaissable':
-        """Clôture par union ensembliste."""
-        return self or autre
+        """
+        Clôture par union ensembliste : les mots connus sont réunis et, si
+        l'un des langages a un automate, l'automate produit (celui des mots
+        de l'autre s'il est fini) reconnaît un mot dès qu'une des
+        composantes le reconnaît.
+        """
+        automate = None
+        if self.automate is not None or self._automate_connu(autre) is not None:
+            automate = self._automate_de(self).union(self._automate_de(autre))
+        return LangageReconnaissable(self.mots | autre.mots, self.alphabet | autre.alphabet,
+                                     automate)
     
     def intersection_ensembliste(self, autre: 'LangageReconnaissable') -> 'LangageReconnaissable':
-        """Clôture par intersection ensembliste."""
-        return self and autre
+        """
+        Clôture par intersection ensembliste : l'automate est le produit
+        construit à la demande depuis les couples accessibles. Si l'un des
+        langages est donné par ses mots, l'intersection est finie : ce sont
+        ceux de ses mots que l'autre langage contient.
+        """
+        alphabet = self.alphabet | autre.alphabet
+        if self.automate is None:
+            return LangageReconnaissable({mot for mot in self.mots if autre.contient_mot(mot)}, alphabet)
+        if self._automate_connu(autre) is None:
+            return LangageReconnaissable({mot for mot in autre.mots if self.contient_mot(mot)}, alphabet)
+        mots = {mot for mot in self.mots | autre.mots
+                if self.contient_mot(mot) and autre.contient_mot(mot)}
+        return LangageReconnaissable(mots, alphabet, self.automate.intersection(autre.automate))
+
+    def difference_ensembliste(self, autre: 'LangageReconnaissable') -> 'LangageReconnaissable':
+        """
+        Clôture par différence ensembliste (produit construit à la demande,
+        avec l'automate des mots de l'autre langage s'il n'en a pas). Un
+        langage donné par ses mots garde ceux que l'autre ne contient pas.
+        """
+        if self.automate is None:
+            return LangageReconnaissable({mot for mot in self.mots if not autre.contient_mot(mot)},
+                                         self.alphabet)
+        mots = {mot for mot in self.mots if not autre.contient_mot(mot)}
+        return LangageReconnaissable(mots, self.alphabet,
+                                     self.automate.difference(self._automate_de(autre)))
     
     def miroir(self) -> 'LangageReconnaissable':
         """Clôture par miroir."""
@@ -45,8 +138,14 @@ class LangageReconnaissable(Langage):
         return self.kleene_tronquee(longueur_max)
     
     def regex_vers_langage(self, expression_reguliere: str) -> None:
-        """Construit le langage depuis une expression régulière."""
-        pass
+        """
+        Construit le langage depuis une expression régulière : le motif est
+        compilé en AFDC minimal, propre à ce langage (voir compiler_regex).
+        """
+        alphabet = frozenset(self.alphabet) if self.alphabet else None
+        self.automate = compiler_regex(expression_reguliere, alphabet)
+        if not self.alphabet:
+            self.alphabet = set(self.automate.alphabet)
     
     def langage_vers_regex(self) -> str:
         """Convertit le langage en expression régulière."""
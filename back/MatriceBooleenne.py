@@ -0,0 +1,145 @@
+from typing import List, Iterable, Optional
+
+
+def _bits(masque: int) -> Iterable[int]:
+    """Indices des bits à 1 d'un entier."""
+    # Lecture de l'écriture binaire retournée : linéaire en la taille du
+    # masque, là où isoler le bit de poids faible recopie l'entier à chaque pas
+    bits = bin(masque)[:1:-1]
+    i = bits.find("1")
+    while i >= 0:
+        yield i
+        i = bits.find("1", i + 1)
+
+
+class MatriceBooleenne:
+    """
+    Matrice booléenne carrée n×n compacte : chaque ligne est un entier
+    dont le bit k vaut 1 si la case (i, k) est vraie.
+
+    Les unions et intersections de lignes sont des opérations sur des
+    entiers (64 cases par mot machine) ; un vecteur booléen (ensemble
+    d'états) est lui aussi un entier.
+    """
+
+    __slots__ = ("n", "lignes", "_hash")
+
+    def __init__(self, n: int, lignes: Optional[List[int]] = None) -> None:
+        """
+        Args:
+            n: Dimension de la matrice
+            lignes: Lignes codées en entiers ; par défaut la matrice nulle
+        """
+        self.n = n
+        self.lignes = list(lignes) if lignes is not None else [0] * n
+        if len(self.lignes) != n:
+            raise ValueError(f"Une matrice {n}×{n} doit avoir {n} lignes")
+        self._hash = None
+
+    @classmethod
+    def identite(cls, n: int) -> 'MatriceBooleenne':
+        return cls(n, [1 << i for i in range(n)])
+
+    @classmethod
+    def depuis_csr(cls, csr, j: int) -> 'MatriceBooleenne':
+        """Matrice de la relation du symbole d'indice j d'un stockage TransitionsCSR."""
+        debuts = csr.debuts[j]
+        cibles = csr.cibles[j]
+        lignes = []
+        for i in range(csr.nb_etats):
+            ligne = 0
+            for position in range(debuts[i], debuts[i + 1]):
+                ligne |= 1 << cibles[position]
+            lignes.append(ligne)
+        return cls(csr.nb_etats, lignes)
+
+    def produit_vecteur(self, vecteur: int) -> int:
+        """Produit vecteur-matrice v·M : union des lignes des indices de v."""
+        lignes = self.lignes
+        resultat = 0
+        for i in _bits(vecteur):
+            resultat |= lignes[i]
+        return resultat
+
+    def __mul__(self, autre: 'MatriceBooleenne') -> 'MatriceBooleenne':
+        """Produit booléen (composition des relations : d'abord self, puis autre)."""
+        if self.n != autre.n:
+            raise ValueError("Dimensions incompatibles")
+        return MatriceBooleenne(self.n, [autre.produit_vecteur(ligne) for ligne in self.lignes])
+
+    def __or__(self, autre: 'MatriceBooleenne') -> 'MatriceBooleenne':
+        if self.n != autre.n:
+            raise ValueError("Dimensions incompatibles")
+        return MatriceBooleenne(self.n, [a | b for a, b in zip(self.lignes, autre.lignes)])
+
+    def transposee(self) -> 'MatriceBooleenne':
+        colonnes = [0] * self.n
+        for i, ligne in enumerate(self.lignes):
+            bit = 1 << i
+            for k in _bits(ligne):
+                colonnes[k] |= bit
+        return MatriceBooleenne(self.n, colonnes)
+
+    def fermeture_transitive(self, reflexive: bool = False) -> 'MatriceBooleenne':
+        """
+        Fermeture transitive (algorithme de Warshall sur les lignes) :
+        la case (i, k) vaut 1 s'il existe un chemin non vide de i à k
+        (ou vide aussi, si reflexive).
+        """
+        lignes = list(self.lignes)
+        for k in range(self.n):
+            bit = 1 << k
+            ligne_k = lignes[k]
+            if not ligne_k:
+                continue
+            for i in range(self.n):
+                if lignes[i] & bit:
+                    lignes[i] |= ligne_k
+        if reflexive:
+            for i in range(self.n):
+                lignes[i] |= 1 << i
+        return MatriceBooleenne(self.n, lignes)
+
+    def est_nulle(self) -> bool:
+        return not any(self.lignes)
+
+    def __eq__(self, autre) -> bool:
+        return isinstance(autre, MatriceBooleenne) and self.lignes == autre.lignes
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self.lignes))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "\n".join(format(ligne, f"0{self.n}b")[::-1] if self.n else "" for ligne in self.lignes)
+
+
+def fermeture_produits(generateurs: List[MatriceBooleenne],
+                       max_elements: Optional[int] = None) -> List[MatriceBooleenne]:
+    """
+    Plus petit ensemble contenant l'identité et les générateurs, clos par
+    produit (le monoïde engendré), par parcours en largeur avec
+    déduplication par hachage.
+
+    Args:
+        generateurs: Matrices de même dimension
+        max_elements: Nombre maximal d'éléments ; ValueError au-delà
+
+    Returns:
+        Les éléments, l'identité en premier, dans l'ordre de découverte
+    """
+    if not generateurs:
+        raise ValueError("Il faut au moins un générateur")
+    identite = MatriceBooleenne.identite(generateurs[0].n)
+    elements = [identite]
+    vus = {identite}
+    for element in elements:
+        for generateur in generateurs:
+            produit = element * generateur
+            if produit not in vus:
+                vus.add(produit)
+                elements.append(produit)
+                if max_elements is not None and len(elements) > max_elements:
+                    raise ValueError(f"Monoïde de plus de {max_elements} éléments")
+    return elements
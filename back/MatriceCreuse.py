@@ -0,0 +1,171 @@
+from array import array
+from typing import Set, Dict, List, Iterable, Iterator, Tuple
+
+
+class TransitionsCSR:
+    """
+    Stockage creux des transitions au format CSR (compressed sparse row).
+
+    Les états et les symboles sont numérotés par de petits entiers. Pour
+    chaque symbole j, la relation de transition est une matrice booléenne
+    creuse n×n rangée en deux tableaux d'entiers :
+    - debuts[j]: array('i') de taille n+1
+    - cibles[j]: array('i') des destinations, ligne après ligne (triées)
+    Les destinations de l'état i avec le symbole j sont
+    cibles[j][debuts[j][i]:debuts[j][i + 1]].
+
+    Les conversions depuis et vers les transitions d'un automate sont en
+    O(n·m + |δ|) ; aucune recherche d'indice dans une liste.
+    """
+
+    def __init__(self, etats: List, symboles: List[str],
+                 debuts: List[array], cibles: List[array]) -> None:
+        """
+        Args:
+            etats: Liste ordonnée des états
+            symboles: Liste ordonnée des symboles
+            debuts: Pour chaque symbole, tableau des débuts de ligne (taille n+1)
+            cibles: Pour chaque symbole, tableau des destinations
+        """
+        if len(debuts) != len(symboles) or len(cibles) != len(symboles):
+            raise ValueError("Il faut un tableau de débuts et de cibles par symbole")
+        self.etats = list(etats)
+        self.symboles = list(symboles)
+        self.indices_etats = {etat: i for i, etat in enumerate(self.etats)}
+        self.indices_symboles = {symbole: j for j, symbole in enumerate(self.symboles)}
+        self.nb_etats = len(self.etats)
+        self.nb_symboles = len(self.symboles)
+        self.debuts = debuts
+        self.cibles = cibles
+
+    @classmethod
+    def depuis_transitions(cls, etats: List, alphabet: Iterable[str],
+                           transitions: Dict) -> 'TransitionsCSR':
+        """
+        Construit le stockage depuis le dictionnaire des transitions d'un automate.
+
+        Args:
+            etats: Liste ordonnée des états
+            alphabet: Symboles de l'automate (ceux des transitions sont ajoutés)
+            transitions: Dictionnaire source -> symbole -> ensemble de destinations
+        """
+        symboles = set(alphabet)
+        for sorties in transitions.values():
+            symboles.update(sorties.keys())
+        symboles = sorted(symboles)
+        indices_etats = {etat: i for i, etat in enumerate(etats)}
+        indices_symboles = {symbole: j for j, symbole in enumerate(symboles)}
+        n = len(etats)
+
+        # Comptage des destinations par ligne, puis sommes préfixes
+        debuts = [array('i', [0]) * (n + 1) for _ in symboles]
+        for source, sorties in transitions.items():
+            i = indices_etats.get(source)
+            if i is None:
+                raise ValueError(f"État source inconnu : {source}")
+            for symbole, destinations in sorties.items():
+                debuts[indices_symboles[symbole]][i + 1] = len(destinations)
+        for ligne in debuts:
+            for i in range(n):
+                ligne[i + 1] += ligne[i]
+
+        cibles = [array('i', [0]) * ligne[n] for ligne in debuts]
+        for source, sorties in transitions.items():
+            i = indices_etats[source]
+            for symbole, destinations in sorties.items():
+                j = indices_symboles[symbole]
+                try:
+                    indices = sorted(indices_etats[destination] for destination in destinations)
+                except KeyError as erreur:
+                    raise ValueError(f"État destination inconnu : {erreur.args[0]}") from None
+                debut = debuts[j][i]
+                cibles[j][debut:debut + len(indices)] = array('i', indices)
+
+        return cls(etats, symboles, debuts, cibles)
+
+    @classmethod
+    def depuis_listes(cls, matrice: List[List[Set[int]]], etats: List,
+                      symboles: List[str]) -> 'TransitionsCSR':
+        """
+        Construit le stockage depuis une matrice n×m d'ensembles d'indices
+        (le format de automate_a_matrice).
+        """
+        n = len(etats)
+        m = len(symboles)
+        if len(matrice) != n or any(len(ligne) != m for ligne in matrice):
+            raise ValueError(f"La matrice doit être de taille {n}×{m}")
+
+        debuts = []
+        cibles = []
+        for j in range(m):
+            ligne_debuts = array('i', [0]) * (n + 1)
+            ligne_cibles = array('i')
+            for i in range(n):
+                destinations = sorted(matrice[i][j])
+                if destinations and not (0 <= destinations[0] and destinations[-1] < n):
+                    raise ValueError(f"Indice d'état hors bornes dans la case ({i}, {j})")
+                ligne_cibles.extend(destinations)
+                ligne_debuts[i + 1] = len(ligne_cibles)
+            debuts.append(ligne_debuts)
+            cibles.append(ligne_cibles)
+        return cls(etats, symboles, debuts, cibles)
+
+    def successeurs(self, i: int, j: int) -> array:
+        """Indices des destinations de l'état i avec le symbole j."""
+        debuts = self.debuts[j]
+        return self.cibles[j][debuts[i]:debuts[i + 1]]
+
+    def aretes(self) -> Iterator[Tuple[int, int, int]]:
+        """Énumère les transitions (i, j, k), ligne par ligne pour chaque symbole."""
+        for j in range(self.nb_symboles):
+            debuts = self.debuts[j]
+            cibles = self.cibles[j]
+            for i in range(self.nb_etats):
+                for position in range(debuts[i], debuts[i + 1]):
+                    yield i, j, cibles[position]
+
+    def nb_transitions(self) -> int:
+        return sum(len(cibles) for cibles in self.cibles)
+
+    def transposee(self) -> 'TransitionsCSR':
+        """Relation inverse (prédécesseurs), en O(n·m + |δ|)."""
+        n = self.nb_etats
+        debuts_inverses = []
+        cibles_inverses = []
+        for j in range(self.nb_symboles):
+            debuts = self.debuts[j]
+            cibles = self.cibles[j]
+            ligne_debuts = array('i', [0]) * (n + 1)
+            for k in cibles:
+                ligne_debuts[k + 1] += 1
+            for i in range(n):
+                ligne_debuts[i + 1] += ligne_debuts[i]
+            ligne_cibles = array('i', [0]) * len(cibles)
+            position = ligne_debuts[:-1]
+            for i in range(n):
+                for p in range(debuts[i], debuts[i + 1]):
+                    k = cibles[p]
+                    ligne_cibles[position[k]] = i
+                    position[k] += 1
+            debuts_inverses.append(ligne_debuts)
+            cibles_inverses.append(ligne_cibles)
+        return TransitionsCSR(self.etats, self.symboles, debuts_inverses, cibles_inverses)
+
+    def vers_transitions(self) -> Dict:
+        """Dictionnaire source -> symbole -> ensemble de destinations (objets états)."""
+        etats = self.etats
+        transitions = {}
+        for i, j, k in self.aretes():
+            transitions.setdefault(etats[i], {}).setdefault(self.symboles[j], set()).add(etats[k])
+        return transitions
+
+    def vers_listes(self) -> List[List[Set[int]]]:
+        """Matrice n×m d'ensembles d'indices (le format de automate_a_matrice)."""
+        matrice = [[set() for _ in range(self.nb_symboles)] for _ in range(self.nb_etats)]
+        for i, j, k in self.aretes():
+            matrice[i][j].add(k)
+        return matrice
+
+    def __repr__(self) -> str:
+        return (f"TransitionsCSR({self.nb_etats} états, {self.nb_symboles} symboles, "
+                f"{self.nb_transitions()} transitions)")
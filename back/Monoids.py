@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Set, Dict, List, Tuple, Optional, Union, Any
+from typing import Set, Dict, List, Tuple, Optional, Union, Any, Sequence
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
 import itertools
 
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : repli sur des boucles Python
+    np = None
+
+
+def _lignes_table(operation: callable, elements: List[Any], debut: int, fin: int) -> List[List[Any]]:
+    """Produits des lignes debut..fin-1 de la table (exécuté dans un processus fils)."""
+    return [[operation(a, b) for b in elements] for a in elements[debut:fin]]
+
 
 class Monoids:#Fonction_CHAP2
     """
@@ -22,20 +34,212 @@ class Monoids:#Fonction_CHAP2
         self.ensemble = ensemble
         self.operation = operation
         self.element_neutre = element_neutre
+        # Table de Cayley (monoïdes construits par depuis_table)
+        self.elements = None
+        self.indices = None
+        self.table = None
+        self.generateurs = None
         if element_neutre not in ensemble:
             print(f"Element neutre absent dans {self.ensemble}")
             exit(0)
 
     
-    def est_associatif(self) -> bool:#Fonction_CHAP2
-        """Vérifie l'associativité de l'opération."""
-        
-        for a,b,c in itertools.combinations(self.ensemble,3):
-            if self.operation(self.operation(a,b),c) == self.operation(a,self.operation(b,c)):
-                associatif = True
-        return associatif
-        
-    
+    @classmethod
+    def depuis_table(cls, elements: List[Any], table: Sequence[Sequence[int]],
+                     neutre: int = 0, generateurs: Optional[List[Any]] = None) -> 'Monoids':
+        """
+        Construit un monoïde fini depuis sa table de Cayley : l'opération
+        devient une lecture de table en O(1).
+
+        Args:
+            elements: Éléments (hachables), numérotés par leur position
+            table: table[i][j] est l'indice du produit elements[i]·elements[j]
+            neutre: Indice de l'élément neutre
+            generateurs: Éléments générateurs du monoïde, s'ils sont connus
+        """
+        if len(table) != len(elements) or any(len(ligne) != len(elements) for ligne in table):
+            raise ValueError("La table de Cayley doit être carrée, de la taille de l'ensemble")
+        elements = list(elements)
+        indices = {element: i for i, element in enumerate(elements)}
+        if len(indices) != len(elements):
+            raise ValueError("Les éléments de la table doivent être distincts")
+        table = [array('i', ligne) for ligne in table]
+
+        def operation(a, b):
+            return elements[table[indices[a]][indices[b]]]
+
+        monoide = cls(set(elements), operation, elements[neutre])
+        monoide.elements = elements
+        monoide.indices = indices
+        monoide.table = table
+        monoide.generateurs = list(generateurs) if generateurs is not None else None
+        return monoide
+
+    def __len__(self) -> int:
+        return len(self.ensemble)
+
+    def est_aperiodique(self) -> bool:
+        """
+        Vérifie que le monoïde (fini) est apériodique : pour tout x, la suite
+        des puissances x, x², ... finit par stagner (x^n = x^(n+1)).
+        """
+        if self.table is not None:
+            table = self.table
+            for x in range(len(self.elements)):
+                vues = set()
+                puissance = x
+                while puissance not in vues:
+                    vues.add(puissance)
+                    suivante = table[puissance][x]
+                    if suivante == puissance:
+                        break
+                    puissance = suivante
+                else:
+                    return False
+            return True
+
+        for x in self.ensemble:
+            vues = set()
+            puissance = x
+            while puissance not in vues:
+                vues.add(puissance)
+                suivante = self.operation(puissance, x)
+                if suivante == puissance:
+                    break
+                puissance = suivante
+            else:
+                return False
+        return True
+
+    def calculer_table(self, processus: int = 1) -> bool:
+        """
+        Précalcule une fois la table de Cayley de l'opération (|S|² appels).
+        Pour une opération coûteuse, les lignes sont réparties entre
+        plusieurs processus ; l'opération doit alors être une fonction de
+        module (sérialisable).
+
+        Args:
+            processus: Nombre de processus de calcul
+
+        Returns:
+            True si l'ensemble est clos par l'opération (la table est alors
+            conservée), False sinon
+        """
+        if self.table is not None:
+            return True
+
+        elements = list(self.ensemble)
+        n = len(elements)
+        if processus > 1 and n > 1:
+            taille = -(-n // processus)
+            debuts = range(0, n, taille)
+            with ProcessPoolExecutor(max_workers=processus) as executeur:
+                morceaux = executeur.map(_lignes_table, itertools.repeat(self.operation),
+                                         itertools.repeat(elements), debuts,
+                                         [debut + taille for debut in debuts])
+                produits = [ligne for morceau in morceaux for ligne in morceau]
+        else:
+            produits = _lignes_table(self.operation, elements, 0, n)
+
+        indices = {element: i for i, element in enumerate(elements)}
+        try:
+            table = [array('i', [indices[produit] for produit in ligne]) for ligne in produits]
+        except KeyError:
+            return False
+
+        self.elements = elements
+        self.indices = indices
+        self.table = table
+        return True
+
+    def _generateurs_indices(self) -> Optional[List[int]]:
+        """
+        Indices des générateurs s'ils engendrent bien l'ensemble (produits
+        à droite depuis les générateurs) et si le neutre l'est vraiment ;
+        None sinon.
+        """
+        if not self.generateurs:
+            return None
+        table = self.table
+        n = len(self.elements)
+        neutre = self.indices[self.element_neutre]
+        if any(table[neutre][x] != x or table[x][neutre] != x for x in range(n)):
+            return None
+
+        generateurs = [self.indices[g] for g in self.generateurs]
+        atteints = bytearray(n)
+        atteints[neutre] = 1
+        file = []
+        for g in generateurs:
+            if not atteints[g]:
+                atteints[g] = 1
+                file.append(g)
+        for x in file:
+            for g in generateurs:
+                y = table[x][g]
+                if not atteints[y]:
+                    atteints[y] = 1
+                    file.append(y)
+        return generateurs if all(atteints) else None
+
+    def contre_exemple_associativite(self, processus: int = 1) -> Optional[Tuple[Any, Any, Any]]:
+        """
+        Cherche un triplet ordonné (a, b, c), répétitions comprises, tel que
+        (a·b)·c != a·(b·c).
+
+        Sur la table de Cayley, le test de Light ne fait varier b que parmi
+        les générateurs connus (O(|G|·|S|²) au lieu de O(|S|³)) ; les
+        comparaisons sont vectorisées avec NumPy s'il est disponible.
+
+        Args:
+            processus: Nombre de processus pour précalculer la table
+
+        Returns:
+            Le premier contre-exemple trouvé, ou None si l'opération est associative
+        """
+        if not self.calculer_table(processus):
+            # Ensemble non clos : vérification directe sur l'opération
+            operation = self.operation
+            for a, b in itertools.product(self.ensemble, repeat=2):
+                ab = operation(a, b)
+                for c in self.ensemble:
+                    if operation(ab, c) != operation(a, operation(b, c)):
+                        return a, b, c
+            return None
+
+        elements = self.elements
+        table = self.table
+        n = len(elements)
+        milieux = self._generateurs_indices()
+        if milieux is None:
+            milieux = range(n)
+
+        if np is not None and n:
+            cayley = np.array(table, dtype=np.int32)
+            for b in milieux:
+                # gauche[a, c] = (a·b)·c ; droite[a, c] = a·(b·c)
+                gauche = cayley[cayley[:, b], :]
+                droite = cayley[:, cayley[b, :]]
+                differences = np.argwhere(gauche != droite)
+                if len(differences):
+                    a, c = differences[0]
+                    return elements[a], elements[b], elements[c]
+            return None
+
+        for b in milieux:
+            ligne_b = table[b]
+            for a in range(n):
+                ligne_ab = table[table[a][b]]
+                ligne_a = table[a]
+                for c in range(n):
+                    if ligne_ab[c] != ligne_a[ligne_b[c]]:
+                        return elements[a], elements[b], elements[c]
+        return None
+
+    def est_associatif(self, processus: int = 1) -> bool:#Fonction_CHAP2
+        """Vérifie l'associativité de l'opération sur tous les triplets ordonnés."""
+        return self.contre_exemple_associativite(processus) is None
+
     def verifier_element_neutre(self) -> bool:
         """Vérifie l'existence de l'élément neutre."""
         pass
@@ -44,22 +248,30 @@ class Monoids:#Fonction_CHAP2
         """Construit un sous-monoïde."""
         pass
     
-    def morphisme(self, autre_monoide: 'Monoids', application: callable) -> bool:#Fonction_CHAP2
-        """Vérifie si une fonction est un morphisme de monoïdes."""
-        condition1 = False
-        condition2 = True
-        
-        if application(self.element_neutre) == autre_monoide.element_neutre:
-            condition1 = True
+    def contre_exemple_morphisme(self, autre_monoide: 'Monoids',
+                                 application: callable) -> Optional[Tuple[Any, ...]]:
+        """
+        Cherche un témoin que l'application n'est pas un morphisme :
+        (element_neutre,) si le neutre n'est pas envoyé sur le neutre, ou un
+        couple ordonné (a, b) tel que f(a·b) != f(a)·f(b).
 
-        for a,b in itertools.combinations(self.ensemble,2):          
-            if application(self.operation(a,b)) != autre_monoide.operation(application(a),application(b)):
-                condition2 = False
-        
-        if condition1 == True and condition2 == True:
-            return True
-        
-        return False 
+        Returns:
+            Le premier témoin trouvé, ou None si l'application est un morphisme
+        """
+        if application(self.element_neutre) != autre_monoide.element_neutre:
+            return (self.element_neutre,)
+
+        images = {a: application(a) for a in self.ensemble}
+        for a, b in itertools.product(self.ensemble, repeat=2):
+            produit = self.operation(a, b)
+            image = images[produit] if produit in images else application(produit)
+            if image != autre_monoide.operation(images[a], images[b]):
+                return a, b
+        return None
+
+    def morphisme(self, autre_monoide: 'Monoids', application: callable) -> bool:#Fonction_CHAP2
+        """Vérifie si une fonction est un morphisme de monoïdes (tous les couples ordonnés)."""
+        return self.contre_exemple_morphisme(autre_monoide, application) is None
 
 
 
@@ -5,39 +5,92 @@ from typing import List, Set
 
 
 
-from typing import List, Set
+import weakref
+from array import array
+from typing import List, Set, Dict, FrozenSet, Iterable, Iterator
+from IndexFacteurs import IndexFacteurs
+
+
+class _Alphabet(frozenset):
+    """Alphabet interné : objet distinct de la clé qui l'indexe dans la table."""
+    __slots__ = ()
+
+
+# Alphabets internés : un seul objet par alphabet, partagé par tous les mots.
+# La table ne garde que des références faibles : un alphabet qui n'est plus
+# utilisé par aucun mot en sort de lui-même.
+_ALPHABETS: "weakref.WeakValueDictionary[FrozenSet[str], _Alphabet]" = weakref.WeakValueDictionary()
+
+
+def alphabet_partage(symboles: Iterable[str]) -> FrozenSet[str]:
+    """Retourne l'alphabet interné (frozenset immuable partagé) contenant ces symboles."""
+    if type(symboles) is _Alphabet:
+        return symboles
+    cle = symboles if isinstance(symboles, frozenset) else frozenset(symboles)
+    alphabet = _ALPHABETS.get(cle)
+    if alphabet is None:
+        # La clé reste un frozenset ordinaire : si c'était l'alphabet lui-même,
+        # la table le garderait en vie
+        alphabet = _Alphabet(cle)
+        _ALPHABETS[cle] = alphabet
+    return alphabet
+
 
 class Mot:
     """
     Classe représentant un mot sur un alphabet 
     Le mot vide est représenté par une chaîne vide ""
+
+    Représentation compacte : le contenu, une référence vers l'alphabet
+    interné (partagé entre tous les mots du même alphabet) et le hachage,
+    calculé une seule fois.
     """
+
+    __slots__ = ("contenu", "alphabet_set", "_hash", "_facteurs", "_prefixes")
     
-    def __init__(self, contenu=None, alphabet: list = None) -> None:
+    def __init__(self, contenu=None, alphabet: list = None, valider: bool = True) -> None:
         """
         Initialise un mot.
         
         Args:
             contenu: Chaîne de caractères représentant le mot ou une instance de Mot pour le constructeur de copie 
-            alphabet: Alphabet du mot (sera converti en set pour l'efficacité)
+            alphabet: Alphabet du mot (interné en frozenset partagé)
+            valider: Vérifier que le contenu est sur l'alphabet ; à désactiver
+                seulement quand le résultat est valide par construction
         """
+        self._hash = None
+        self._facteurs = None
+        self._prefixes = None
         if isinstance(contenu, Mot):
-            # Constructeur de copie
+            # Constructeur de copie : l'alphabet immuable est partagé
             self.contenu = contenu.contenu
-            self.alphabet = contenu.alphabet.copy()  
-            self.alphabet_set = contenu.alphabet_set.copy()  
+            self.alphabet_set = contenu.alphabet_set
         else:
             # Constructeur normal
             self.contenu = contenu or ""  # Mot vide = chaîne vide, pas de maux de tetes
             
             if alphabet is not None:
-                alphabet_copy = alphabet.copy()
-                self.alphabet_set = set(alphabet_copy)
-                self.alphabet = list(self.alphabet_set)
-                self.__validate_entry(self.contenu, self.alphabet_set)
+                self.alphabet_set = alphabet_partage(alphabet)
+                if valider:
+                    self.__validate_entry(self.contenu, self.alphabet_set)
             else:
-                self.alphabet_set = self.__calculer_alphabet_set__(self.contenu)
-                self.alphabet = list(self.alphabet_set)
+                self.alphabet_set = alphabet_partage(self.__calculer_alphabet_set__(self.contenu))
+
+    @classmethod
+    def _creer(cls, contenu: str, alphabet_set: FrozenSet[str]) -> 'Mot':
+        """Construction interne sans validation, sur un alphabet déjà interné."""
+        mot = cls.__new__(cls)
+        mot.contenu = contenu
+        mot.alphabet_set = alphabet_set
+        mot._hash = None
+        mot._facteurs = None
+        mot._prefixes = None
+        return mot
+
+    @property
+    def alphabet(self) -> List[str]:
+        """Alphabet du mot sous forme de liste (copie)."""
+        return list(self.alphabet_set)
     
     def est_mot_vide(self) -> bool:
         """Vérifie si le mot est le mot vide (epsilon)."""
@@ -51,35 +104,51 @@ class Mot:
         """Ajoute une occurrence d'un symbole à droite."""
         if symbole not in self.alphabet_set:
             raise ValueError(f"Le symbole '{symbole}' n'est pas dans l'alphabet")
-        return Mot(self.contenu + symbole, self.alphabet)
+        return Mot._creer(self.contenu + symbole, self.alphabet_set)
     
     def adjonction_occurrence_gauche(self, symbole: str) -> 'Mot':
         """Ajoute une occurrence d'un symbole à gauche."""
         if symbole not in self.alphabet_set:
             raise ValueError(f"Le symbole '{symbole}' n'est pas dans l'alphabet")
-        return Mot(symbole + self.contenu, self.alphabet)
+        return Mot._creer(symbole + self.contenu, self.alphabet_set)
     
     def concatenation(self, autre_mot: 'Mot') -> 'Mot':
         """Concatène avec un autre mot."""
-        if self.alphabet_set != autre_mot.alphabet_set:
+        if self.alphabet_set is not autre_mot.alphabet_set and self.alphabet_set != autre_mot.alphabet_set:
             raise ValueError("Les alphabets sont différents")
-        return Mot(self.contenu + autre_mot.contenu, self.alphabet)    
+        return Mot._creer(self.contenu + autre_mot.contenu, self.alphabet_set)    
     
+    def index_facteurs(self) -> IndexFacteurs:
+        """Index des facteurs (automate des suffixes), construit une fois en temps linéaire."""
+        if self._facteurs is None:
+            self._facteurs = IndexFacteurs(self.contenu)
+        return self._facteurs
+
+    def est_facteur(self, facteur) -> bool:
+        """Vérifie si facteur (Mot ou chaîne) est un facteur du mot, en O(|facteur|)."""
+        return self.index_facteurs().contient(facteur)
+
+    def nombre_occurrences(self, facteur) -> int:
+        """Nombre d'occurrences (éventuellement chevauchantes) d'un facteur."""
+        return self.index_facteurs().nombre_occurrences(facteur)
+
+    def nombre_facteurs_distincts(self) -> int:
+        """Nombre de facteurs distincts, mot vide compris."""
+        return self.index_facteurs().nombre_facteurs_distincts()
+
+    def facteurs_distincts(self) -> Iterator['Mot']:
+        """Énumère paresseusement les facteurs distincts (ordre lexicographique), mot vide compris."""
+        alphabet = self.alphabet_set
+        for facteur in self.index_facteurs().facteurs():
+            yield Mot._creer(facteur, alphabet)
+
+    def plus_long_facteur_repete(self) -> 'Mot':
+        """Plus long facteur ayant au moins deux occurrences."""
+        return Mot._creer(self.index_facteurs().plus_long_facteur_repete(), self.alphabet_set)
+
     def liste_sous_mots(self) -> List['Mot']:
-        """Retourne la liste de tous les sous-mots (facteurs)."""
-        if self.est_mot_vide():
-            return [Mot("", self.alphabet)]  
-        
-        sous_mots = []
-        n = len(self.contenu)
-        
-        sous_mots.append(Mot("", self.alphabet))
-        
-        for i in range(n):
-            for j in range(i+1, n+1):
-                sous_mots.append(Mot(self.contenu[i:j], self.alphabet))
-        
-        return sous_mots
+        """Retourne la liste des sous-mots (facteurs) distincts, mot vide compris."""
+        return list(self.facteurs_distincts())
     
     def facteur_gauche(self, longueur: int) -> 'Mot':
         """Retourne le facteur gauche de longueur donnée."""
@@ -87,12 +156,12 @@ class Mot:
             raise ValueError("La longueur doit être positive ou nulle")
         
         if longueur == 0:
-            return Mot("", self.alphabet)  # Mot vide
+            return Mot._creer("", self.alphabet_set)  # Mot vide
         
         if longueur > len(self.contenu):
             raise ValueError(f"Longueur demandée {longueur} > longueur du mot {len(self.contenu)}")
         
-        return Mot(self.contenu[:longueur], self.alphabet)
+        return Mot._creer(self.contenu[:longueur], self.alphabet_set)
     
     def facteur_droit(self, longueur: int) -> 'Mot':
         """Retourne le facteur droit de longueur donnée."""
@@ -100,12 +169,12 @@ class Mot:
             raise ValueError("La longueur doit être positive ou nulle")
         
         if longueur == 0:
-            return Mot("", self.alphabet)  # Mot vide
+            return Mot._creer("", self.alphabet_set)  # Mot vide
         
         if longueur > len(self.contenu):
             raise ValueError(f"Longueur demandée {longueur} > longueur du mot {len(self.contenu)}")
         
-        return Mot(self.contenu[-longueur:], self.alphabet)
+        return Mot._creer(self.contenu[-longueur:], self.alphabet_set)
 
     def caracteres_utilises(self) -> Set[str]:
         """Retourne l'ensemble des caractères réellement utilisés dans le mot."""
@@ -119,8 +188,33 @@ class Mot:
     
     def caracteres_non_utilises(self) -> Set[str]:
         """Retourne les caractères de l'alphabet non utilisés dans le mot."""
-        return self.alphabet_set - set(self.contenu)
+        return set(self.alphabet_set - set(self.contenu))
     
+    def fonction_prefixe(self) -> array:
+        """
+        Fonction préfixe (fonction d'échec de Knuth-Morris-Pratt), calculée
+        une fois en O(n) : la case i est la longueur de la plus longue
+        bordure propre de contenu[:i + 1].
+        """
+        if self._prefixes is None:
+            contenu = self.contenu
+            prefixes = array('i', [0]) * len(contenu)
+            k = 0
+            for i in range(1, len(contenu)):
+                while k and contenu[i] != contenu[k]:
+                    k = prefixes[k - 1]
+                if contenu[i] == contenu[k]:
+                    k += 1
+                prefixes[i] = k
+            self._prefixes = prefixes
+        return self._prefixes
+
+    def periode_minimale(self) -> int:
+        """Plus petite période du mot (0 pour le mot vide)."""
+        if self.est_mot_vide():
+            return 0
+        return len(self.contenu) - self.fonction_prefixe()[-1]
+
     def est_periodique(self, periode: int) -> bool:
         """Vérifie si le mot est périodique avec la période donnée."""
         if self.est_mot_vide():
@@ -129,21 +223,39 @@ class Mot:
         if periode <= 0:
             return False
         
-        if len(self.contenu) % periode != 0:
+        n = len(self.contenu)
+        if n % periode != 0:
             return False
         
-        pattern = self.contenu[:periode]
-        for i in range(periode, len(self.contenu), periode):
-            if self.contenu[i:i+periode] != pattern:
-                return False
-        return True
+        # Une période qui divise n est un multiple de la période minimale (Fine et Wilf)
+        return periode == n or periode % self.periode_minimale() == 0
     
     def est_primitif(self) -> bool:
         """Vérifie si le mot est primitif."""
         if self.est_mot_vide():
             return True  # Convention : le mot vide est primitif
         
-        return not any(self.est_periodique(i) for i in range(1, len(self.contenu)//2 + 1))
+        periode = self.periode_minimale()
+        return periode == len(self.contenu) or len(self.contenu) % periode != 0
+
+    def racine_primitive(self) -> 'Mot':
+        """Plus court mot r tel que le mot soit une puissance de r."""
+        periode = self.periode_minimale()
+        if periode and len(self.contenu) % periode == 0:
+            return Mot._creer(self.contenu[:periode], self.alphabet_set)
+        return Mot._creer(self.contenu, self.alphabet_set)
+
+    def bordures(self) -> List['Mot']:
+        """Bordures propres non vides (à la fois préfixes et suffixes), de la plus longue à la plus courte."""
+        if self.est_mot_vide():
+            return []
+        prefixes = self.fonction_prefixe()
+        bordures = []
+        longueur = prefixes[-1]
+        while longueur:
+            bordures.append(Mot._creer(self.contenu[:longueur], self.alphabet_set))
+            longueur = prefixes[longueur - 1]
+        return bordures
     
     def __str__(self) -> str:
         return self.contenu if self.contenu else "ε"  # Affichage epsilon pour mot vide
@@ -158,8 +270,9 @@ class Mot:
     
     def __eq__(self, autre: 'Mot') -> bool:
         """Égalité entre mots."""
-        return (self.contenu == autre.contenu and 
-                self.alphabet_set == autre.alphabet_set)
+        return (self.contenu == autre.contenu and
+                (self.alphabet_set is autre.alphabet_set or
+                 self.alphabet_set == autre.alphabet_set))
     
     def __add__(self, autre: 'Mot') -> 'Mot':
         """Surcharge de + pour la concaténation."""
@@ -172,7 +285,9 @@ class Mot:
         return set(contenu) if contenu else set()
     
     def __hash__(self):
-        return hash((self.contenu, frozenset(self.alphabet_set)))
+        if self._hash is None:
+            self._hash = hash((self.contenu, self.alphabet_set))
+        return self._hash
     
     def __iter__(self):
         """Permet l'itération sur les caractères du mot."""
@@ -0,0 +1,56 @@
+from typing import Set, List, Optional, Union, FrozenSet
+from Etat import Etat
+from Automate import Automate, AFDC, construire_produit
+from ExpressionReguliere import compiler_regex
+
+
+class AutomateMultiMotifs(AFDC):
+    """
+    Automate produit de plusieurs motifs (expressions régulières ou automates).
+
+    Chaque état porte l'ensemble des identifiants des motifs qu'il reconnaît
+    (l'indice du motif dans la liste fournie). Un mot n'est lu qu'une seule
+    fois, quel que soit le nombre de motifs, et tous les motifs qui le
+    reconnaissent sont rapportés.
+    """
+
+    def __init__(self, motifs: List[Union[str, Automate]],
+                 alphabet: Optional[Set[str]] = None) -> None:
+        """
+        Construit l'automate produit des motifs.
+
+        Args:
+            motifs: Expressions régulières (compilées via compiler_regex) ou automates
+            alphabet: Alphabet commun des expressions régulières
+        """
+        if not motifs:
+            raise ValueError("Il faut au moins un motif")
+        alphabet_regex = frozenset(alphabet) if alphabet is not None else None
+        automates = [compiler_regex(motif, alphabet_regex) if isinstance(motif, str) else motif
+                     for motif in motifs]
+
+        produit, etiquettes = construire_produit(
+            automates,
+            lambda finaux: frozenset(i for i, final in enumerate(finaux) if final))
+
+        super().__init__(produit.alphabet, produit.etats, produit.etat_initial,
+                         produit.etats_finaux)
+        self.transitions = produit.transitions
+        self.nb_motifs = len(motifs)
+        self.motifs_par_etat = etiquettes
+
+    def motifs_de_etat(self, etat: Etat) -> FrozenSet[int]:
+        """Retourne les identifiants des motifs reconnus dans un état."""
+        return self.motifs_par_etat.get(etat, frozenset())
+
+    def motifs_reconnus(self, mot) -> FrozenSet[int]:
+        """Retourne, en une seule lecture du mot, les identifiants des motifs qui le reconnaissent."""
+        table = self.compiler()
+        i = table.lire(mot)
+        if i < 0:
+            return frozenset()
+        return self.motifs_par_etat[table.etats[i]]
+
+    def motifs_reconnus_lot(self, mots) -> List[FrozenSet[int]]:
+        """Retourne les motifs reconnus par chaque mot d'un lot, dans l'ordre d'entrée."""
+        return [self.motifs_reconnus(mot) for mot in mots]
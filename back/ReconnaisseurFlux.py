@@ -0,0 +1,94 @@
+import codecs
+from typing import Set, Union
+
+
+class ReconnaisseurFlux:
+    """
+    Reconnaissance incrémentale d'un mot reçu par morceaux.
+
+    Le mot n'est jamais matérialisé : seul l'état courant (un indice de la
+    table compilée pour un automate déterministe, un ensemble d'états
+    sinon) est conservé entre deux appels à feed(). Le découpage en
+    morceaux ne change pas le résultat et la mémoire utilisée ne dépend
+    pas de la taille de l'entrée.
+
+    Les morceaux peuvent être des chaînes (str) ou des octets (bytes,
+    bytearray, memoryview, tranche de mmap) ; les octets sont décodés de
+    façon incrémentale, un caractère coupé entre deux morceaux est donc
+    correctement reconstitué.
+    """
+
+    def __init__(self, automate, encodage: str = "utf-8") -> None:
+        """
+        Initialise le reconnaisseur.
+
+        Args:
+            automate: Automate sur lequel s'effectue la reconnaissance
+            encodage: Encodage utilisé pour décoder les morceaux en octets
+        """
+        self.automate = automate
+        self.encodage = encodage
+        self.reset()
+
+    def reset(self) -> None:
+        """Revient à l'état initial, prêt à lire un nouveau mot."""
+        self._decodeur = codecs.getincrementaldecoder(self.encodage)()
+        self.nb_symboles_lus = 0
+
+        # États coaccessibles (parcours inverse depuis les états finaux de l'index du graphe)
+        index = self.automate.index_graphe()
+        if self.automate.est_deterministe():
+            self._table = self.automate.compiler()
+            self._indice = 0
+            self._frontiere = None
+            self._vivants = bytearray(index.est_coaccessible(etat) for etat in self._table.etats)
+        else:
+            self._table = None
+            self._indice = None
+            self._frontiere = self.automate._frontiere_initiale()
+            self._vivants = {etat for etat in index.etats if index.est_coaccessible(etat)}
+
+    def feed(self, morceau: Union[str, bytes, bytearray, memoryview]) -> None:
+        """Lit un morceau du mot."""
+        if self.est_bloque():
+            return
+
+        if not isinstance(morceau, str):
+            morceau = self._decodeur.decode(morceau)
+        self.nb_symboles_lus += len(morceau)
+
+        if self._table is not None:
+            self._indice = self._table.lire(morceau, self._indice)
+        else:
+            self._frontiere = self.automate._avancer_frontiere(self._frontiere, morceau)
+
+    def est_bloque(self) -> bool:
+        """
+        Vérifie si plus aucune suite ne peut mener à un état final : calcul
+        bloqué, ou seulement des états non coaccessibles (état puits...).
+        """
+        if self._table is not None:
+            return self._indice < 0 or not self._vivants[self._indice]
+        return self._frontiere.isdisjoint(self._vivants)
+
+    def etats_courants(self) -> Set:
+        """Retourne l'ensemble des états atteints après les morceaux lus."""
+        if self._table is not None:
+            return {self._table.etats[self._indice]} if self._indice >= 0 else set()
+        return set(self._frontiere)
+
+    def accepte(self) -> bool:
+        """Détermine si le mot lu jusqu'ici est reconnu."""
+        if self.est_bloque():
+            return False
+
+        # Un caractère multi-octets incomplet : le mot n'est pas terminé
+        if self._decodeur.getstate()[0]:
+            return False
+
+        if self._table is not None:
+            return self._table.finaux[self._indice] == 1
+        return not self._frontiere.isdisjoint(self.automate.etats_finaux)
+
+    def __repr__(self) -> str:
+        return f"ReconnaisseurFlux({self.nb_symboles_lus} symboles lus)"
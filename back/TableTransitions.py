@@ -0,0 +1,111 @@
+from array import array
+from typing import Set, Dict, List, Optional, Iterable
+
+
+class TableTransitions:
+    """
+    Forme compilée (figée) d'un automate déterministe.
+
+    Les états et les symboles sont numérotés par de petits entiers :
+    - etats: liste des états, l'état initial porte l'indice 0
+    - symboles: liste triée des symboles
+    - table: array('i') à plat de taille n*m, table[i*m + j] est l'indice
+      de l'état atteint depuis l'état i avec le symbole j (-1 si aucun)
+    - finaux: bytearray de taille n (1 si l'état est final)
+
+    La reconnaissance ne manipule plus que des entiers : plus de hachage
+    d'objets Etat ni de dictionnaires imbriqués à chaque symbole.
+    """
+
+    def __init__(self, etats: List, alphabet: Iterable[str],
+                 transitions: Dict, etats_finaux: Set) -> None:
+        """
+        Compile une table depuis les composants d'un automate.
+
+        Args:
+            etats: Liste ordonnée des états, l'état initial en premier
+            alphabet: Symboles de l'automate
+            transitions: Dictionnaire source -> symbole -> ensemble de destinations
+            etats_finaux: Ensemble des états finaux
+        """
+        symboles = set(alphabet)
+        for sorties in transitions.values():
+            symboles.update(sorties.keys())
+
+        self.etats = list(etats)
+        self.symboles = sorted(symboles)
+        self.indices_etats = {etat: i for i, etat in enumerate(self.etats)}
+        self.indices_symboles = {symbole: j for j, symbole in enumerate(self.symboles)}
+
+        n = len(self.etats)
+        m = len(self.symboles)
+        self.nb_etats = n
+        self.nb_symboles = m
+        self.table = array('i', [-1]) * (n * m)
+        self.finaux = bytearray(n)
+
+        for source, sorties in transitions.items():
+            i = self.indices_etats.get(source)
+            if i is None:
+                raise ValueError(f"État source inconnu : {source}")
+            for symbole, destinations in sorties.items():
+                if not destinations:
+                    continue
+                if len(destinations) > 1:
+                    raise ValueError(f"Automate non déterministe en {source} avec '{symbole}'")
+                destination = next(iter(destinations))
+                k = self.indices_etats.get(destination)
+                if k is None:
+                    raise ValueError(f"État destination inconnu : {destination}")
+                self.table[i * m + self.indices_symboles[symbole]] = k
+
+        for etat in etats_finaux:
+            i = self.indices_etats.get(etat)
+            if i is not None:
+                self.finaux[i] = 1
+
+    def suivant(self, i: int, j: int) -> int:
+        """Retourne l'indice de l'état atteint depuis i avec le symbole j (-1 si aucun)."""
+        return self.table[i * self.nb_symboles + j]
+
+    def transition(self, etat, symbole: str) -> Optional[object]:
+        """Retourne l'état atteint depuis un état avec un symbole, ou None."""
+        i = self.indices_etats.get(etat)
+        j = self.indices_symboles.get(symbole)
+        if i is None or j is None:
+            return None
+        k = self.table[i * self.nb_symboles + j]
+        return self.etats[k] if k >= 0 else None
+
+    def est_complete(self) -> bool:
+        """Vérifie que chaque case de la table est définie."""
+        return -1 not in self.table
+
+    def lire(self, mot, i: int = 0) -> int:
+        """
+        Lit un mot depuis l'état d'indice i.
+        Retourne l'indice de l'état atteint, ou -1 si le calcul est bloqué.
+        """
+        table = self.table
+        m = self.nb_symboles
+        indices_symboles = self.indices_symboles
+
+        for symbole in mot:
+            j = indices_symboles.get(symbole)
+            if j is None:
+                return -1
+            i = table[i * m + j]
+            if i < 0:
+                return -1
+        return i
+
+    def reconnaitre(self, mot) -> bool:
+        """Détermine si un mot est reconnu, directement sur la table."""
+        i = self.lire(mot)
+        return i >= 0 and self.finaux[i] == 1
+
+    def __len__(self) -> int:
+        return self.nb_etats
+
+    def __repr__(self) -> str:
+        return f"TableTransitions({self.nb_etats} états, {self.nb_symboles} symboles)"
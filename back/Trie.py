@@ -0,0 +1,461 @@
+from array import array
+from typing import Dict, List, Iterable, Iterator, Optional, Tuple
+
+
+class Trie:
+    """
+    Ensemble fini de mots rangé en arbre des préfixes (trie) : les
+    préfixes communs sont partagés, et chaque nœud connaît le nombre et
+    les longueurs extrêmes des mots de son sous-arbre, ce qui permet
+    d'élaguer les requêtes par préfixe et par longueur.
+
+    Représentation à plat : un nœud est un entier, ses données sont dans
+    des tableaux typés indexés par ce numéro, et ses arcs forment une liste
+    chaînée, triée par symbole, rangée elle aussi dans des tableaux :
+    - finaux[v]: 1 si le mot menant à v appartient à l'ensemble
+    - nombres[v]: nombre de mots du sous-arbre
+    - lmin[v], lmax[v]: longueurs minimale et maximale de ces mots (-1 si aucun)
+    - premiers[v]: premier arc sortant de v (-1 si aucun)
+    - codes[e], cibles[e], suivants[e]: symbole (codé), nœud atteint et
+      arc suivant de l'arc e ; symboles[code] est le symbole
+    Un nœud et son arc entrant occupent une trentaine d'octets, sans objet
+    ni dictionnaire Python par nœud.
+
+    compacter() fusionne les sous-arbres identiques (les suffixes communs
+    sont alors partagés aussi) : on obtient l'automate acyclique minimal
+    (DAWG), en lecture seule.
+    """
+
+    def __init__(self, mots: Iterable[str] = ()) -> None:
+        """Construit le trie des mots (chaînes ou objets itérables de symboles)."""
+        self.symboles: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.finaux = bytearray()
+        self.nombres = array('i')
+        self.lmin = array('i')
+        self.lmax = array('i')
+        self.premiers = array('i')
+        self.codes = array('i')
+        self.cibles = array('i')
+        self.suivants = array('i')
+        self._noeuds_libres: List[int] = []
+        self._arcs_libres: List[int] = []
+        self.racine = self._nouveau_noeud()
+        self.compacte = False
+        for mot in mots:
+            self.ajouter(mot)
+
+    def _nouveau_noeud(self) -> int:
+        """Alloue un nœud sans mot ni arc (en réutilisant un nœud libéré)."""
+        if self._noeuds_libres:
+            v = self._noeuds_libres.pop()
+            self.finaux[v] = 0
+            self.nombres[v] = 0
+            self.lmin[v] = -1
+            self.lmax[v] = -1
+            self.premiers[v] = -1
+            return v
+        self.finaux.append(0)
+        self.nombres.append(0)
+        self.lmin.append(-1)
+        self.lmax.append(-1)
+        self.premiers.append(-1)
+        return len(self.finaux) - 1
+
+    def _nouvel_arc(self, code: int, cible: int, suivant: int) -> int:
+        if self._arcs_libres:
+            e = self._arcs_libres.pop()
+            self.codes[e] = code
+            self.cibles[e] = cible
+            self.suivants[e] = suivant
+            return e
+        self.codes.append(code)
+        self.cibles.append(cible)
+        self.suivants.append(suivant)
+        return len(self.codes) - 1
+
+    def _code(self, symbole: str) -> int:
+        code = self._codes.get(symbole)
+        if code is None:
+            code = len(self.symboles)
+            self._codes[symbole] = code
+            self.symboles.append(symbole)
+        return code
+
+    def _verifier_modifiable(self) -> None:
+        if self.compacte:
+            raise ValueError("Un trie compacté (DAWG) est en lecture seule")
+
+    def _arc(self, noeud: int, symbole: str) -> int:
+        """Arc sortant de noeud étiqueté par symbole, ou -1."""
+        code = self._codes.get(symbole)
+        if code is None:
+            return -1
+        codes = self.codes
+        suivants = self.suivants
+        e = self.premiers[noeud]
+        while e >= 0 and codes[e] != code:
+            e = suivants[e]
+        return e
+
+    def enfant(self, noeud: int, symbole: str) -> Optional[int]:
+        """Nœud atteint depuis noeud en lisant symbole, ou None."""
+        e = self._arc(noeud, symbole)
+        return self.cibles[e] if e >= 0 else None
+
+    def enfants(self, noeud: int) -> Iterator[Tuple[str, int]]:
+        """Couples (symbole, nœud atteint) des arcs sortants, par symbole croissant."""
+        e = self.premiers[noeud]
+        while e >= 0:
+            yield self.symboles[self.codes[e]], self.cibles[e]
+            e = self.suivants[e]
+
+    def est_final(self, noeud: int) -> bool:
+        return self.finaux[noeud] == 1
+
+    def _enfant_ou_nouveau(self, noeud: int, symbole: str) -> int:
+        """Nœud atteint en lisant symbole, créé (à sa place dans la liste triée) au besoin."""
+        symboles = self.symboles
+        codes = self.codes
+        precedent = -1
+        e = self.premiers[noeud]
+        while e >= 0:
+            s = symboles[codes[e]]
+            if s == symbole:
+                return self.cibles[e]
+            if s > symbole:
+                break
+            precedent = e
+            e = self.suivants[e]
+        enfant = self._nouveau_noeud()
+        arc = self._nouvel_arc(self._code(symbole), enfant, e)
+        if precedent < 0:
+            self.premiers[noeud] = arc
+        else:
+            self.suivants[precedent] = arc
+        return enfant
+
+    def _mettre_a_jour(self, noeud: int) -> None:
+        """Recalcule les métadonnées d'un nœud depuis celles de ses enfants."""
+        final = self.finaux[noeud] == 1
+        nombre = 1 if final else 0
+        lmin = 0 if final else -1
+        lmax = 0 if final else -1
+        e = self.premiers[noeud]
+        while e >= 0:
+            enfant = self.cibles[e]
+            nombre += self.nombres[enfant]
+            if self.lmin[enfant] >= 0 and (lmin < 0 or self.lmin[enfant] + 1 < lmin):
+                lmin = self.lmin[enfant] + 1
+            if self.lmax[enfant] + 1 > lmax:
+                lmax = self.lmax[enfant] + 1
+            e = self.suivants[e]
+        self.nombres[noeud] = nombre
+        self.lmin[noeud] = lmin
+        self.lmax[noeud] = lmax
+
+    def ajouter(self, mot) -> bool:
+        """Ajoute un mot ; retourne False s'il était déjà présent."""
+        self._verifier_modifiable()
+        chemin = [self.racine]
+        noeud = self.racine
+        for symbole in mot:
+            noeud = self._enfant_ou_nouveau(noeud, symbole)
+            chemin.append(noeud)
+        if self.finaux[noeud]:
+            return False
+
+        self.finaux[noeud] = 1
+        longueur = len(chemin) - 1
+        nombres, lmin, lmax = self.nombres, self.lmin, self.lmax
+        for profondeur, noeud in enumerate(chemin):
+            reste = longueur - profondeur
+            nombres[noeud] += 1
+            if lmin[noeud] < 0 or reste < lmin[noeud]:
+                lmin[noeud] = reste
+            if reste > lmax[noeud]:
+                lmax[noeud] = reste
+        return True
+
+    def supprimer(self, mot) -> bool:
+        """Retire un mot ; retourne False s'il était absent. Les nœuds vidés sont libérés."""
+        self._verifier_modifiable()
+        chemin = [(self.racine, -1)]
+        noeud = self.racine
+        for symbole in mot:
+            arc = self._arc(noeud, symbole)
+            if arc < 0:
+                return False
+            noeud = self.cibles[arc]
+            chemin.append((noeud, arc))
+        if not self.finaux[noeud]:
+            return False
+
+        self.finaux[noeud] = 0
+        for i in range(len(chemin) - 1, -1, -1):
+            noeud, arc = chemin[i]
+            self._mettre_a_jour(noeud)
+            if i and self.nombres[noeud] == 0:
+                self._retirer_arc(chemin[i - 1][0], arc)
+                self._noeuds_libres.append(noeud)
+        return True
+
+    def _retirer_arc(self, noeud: int, arc: int) -> None:
+        e = self.premiers[noeud]
+        if e == arc:
+            self.premiers[noeud] = self.suivants[arc]
+        else:
+            while self.suivants[e] != arc:
+                e = self.suivants[e]
+            self.suivants[e] = self.suivants[arc]
+        self._arcs_libres.append(arc)
+
+    def noeud(self, prefixe) -> Optional[int]:
+        """Nœud atteint en lisant le préfixe, ou None."""
+        codes_symboles = self._codes
+        premiers, codes, cibles, suivants = self.premiers, self.codes, self.cibles, self.suivants
+        noeud = self.racine
+        for symbole in prefixe:
+            code = codes_symboles.get(symbole)
+            if code is None:
+                return None
+            e = premiers[noeud]
+            while e >= 0 and codes[e] != code:
+                e = suivants[e]
+            if e < 0:
+                return None
+            noeud = cibles[e]
+        return noeud
+
+    def __contains__(self, mot) -> bool:
+        noeud = self.noeud(mot)
+        return noeud is not None and self.finaux[noeud] == 1
+
+    def __len__(self) -> int:
+        return self.nombres[self.racine]
+
+    def mots_depuis(self, noeud: int, prefixe: str,
+                    longueur_min: int = 0, longueur_max: Optional[int] = None) -> Iterator[str]:
+        """
+        Mots du sous-arbre (préfixés), dans l'ordre lexicographique, dont la
+        longueur restante est dans [longueur_min, longueur_max] ; les
+        sous-arbres hors bornes sont élagués grâce à lmin et lmax.
+        """
+        nombres, lmin, lmax, finaux = self.nombres, self.lmin, self.lmax, self.finaux
+        premiers, codes, cibles, suivants = self.premiers, self.codes, self.cibles, self.suivants
+        noms = self.symboles
+
+        def utile(x: int, profondeur: int) -> bool:
+            if nombres[x] == 0 or lmax[x] < longueur_min - profondeur:
+                return False
+            return longueur_max is None or lmin[x] <= longueur_max - profondeur
+
+        if not utile(noeud, 0):
+            return
+        symboles = [prefixe]
+        # Pile des arcs restant à parcourir, un curseur par profondeur
+        pile = [premiers[noeud]]
+        if finaux[noeud] and longueur_min <= 0:
+            yield prefixe
+        while pile:
+            e = pile[-1]
+            if e < 0:
+                pile.pop()
+                symboles.pop()
+                continue
+            pile[-1] = suivants[e]
+            enfant = cibles[e]
+            profondeur = len(pile)
+            if not utile(enfant, profondeur):
+                continue
+            symboles.append(noms[codes[e]])
+            if finaux[enfant] and longueur_min <= profondeur and (longueur_max is None or profondeur <= longueur_max):
+                yield "".join(symboles)
+            pile.append(premiers[enfant])
+
+    def __iter__(self) -> Iterator[str]:
+        """Mots dans l'ordre lexicographique."""
+        return self.mots_depuis(self.racine, "")
+
+    def mots_de_prefixe(self, prefixe: str) -> Iterator[str]:
+        """Mots commençant par le préfixe, sans parcourir les autres."""
+        noeud = self.noeud(prefixe)
+        if noeud is None:
+            return iter(())
+        return self.mots_depuis(noeud, prefixe)
+
+    def nombre_de_prefixe(self, prefixe: str) -> int:
+        """Nombre de mots commençant par le préfixe, en O(|prefixe|)."""
+        noeud = self.noeud(prefixe)
+        return self.nombres[noeud] if noeud is not None else 0
+
+    def mots_de_longueur(self, longueur: int) -> Iterator[str]:
+        """Mots de longueur donnée ; les sous-arbres trop courts ou trop longs sont élagués."""
+        return self.mots_depuis(self.racine, "", longueur, longueur)
+
+    def longueur_maximale(self) -> int:
+        return max(self.lmax[self.racine], 0)
+
+    def longueur_minimale(self) -> int:
+        return max(self.lmin[self.racine], 0)
+
+    def _noeuds_accessibles(self) -> List[int]:
+        """Nœuds atteignables depuis la racine (partagés comptés une fois), racine en tête."""
+        vus = bytearray(len(self.finaux))
+        vus[self.racine] = 1
+        ordre = [self.racine]
+        for noeud in ordre:
+            e = self.premiers[noeud]
+            while e >= 0:
+                enfant = self.cibles[e]
+                if not vus[enfant]:
+                    vus[enfant] = 1
+                    ordre.append(enfant)
+                e = self.suivants[e]
+        return ordre
+
+    def compacter(self) -> 'Trie':
+        """
+        Fusionne les sous-arbres identiques (minimisation de l'automate
+        acyclique, parcours postfixe avec registre de signatures), puis
+        range les nœuds restants dans des tableaux neufs (les nœuds fusionnés
+        et libérés ne sont pas conservés). Le trie devient un DAWG en
+        lecture seule.
+        """
+        premiers, codes, cibles, suivants = self.premiers, self.codes, self.cibles, self.suivants
+        registre: Dict[Tuple, int] = {}
+        canoniques = array('i', [-1]) * len(self.finaux)
+        pile = [(self.racine, False)]
+        while pile:
+            noeud, visite = pile.pop()
+            if canoniques[noeud] >= 0:
+                continue
+            if not visite:
+                pile.append((noeud, True))
+                e = premiers[noeud]
+                while e >= 0:
+                    if canoniques[cibles[e]] < 0:
+                        pile.append((cibles[e], False))
+                    e = suivants[e]
+                continue
+            signature = [self.finaux[noeud]]
+            e = premiers[noeud]
+            while e >= 0:
+                signature.append(codes[e])
+                signature.append(canoniques[cibles[e]])
+                e = suivants[e]
+            canoniques[noeud] = registre.setdefault(tuple(signature), noeud)
+
+        # Renumérotation des nœuds canoniques dans l'ordre du parcours en largeur
+        nouveau = Trie()
+        nouveau.symboles = self.symboles
+        nouveau._codes = self._codes
+        numeros = {self.racine: nouveau.racine}
+        ordre = [self.racine]
+        for noeud in ordre:
+            v = numeros[noeud]
+            nouveau.finaux[v] = self.finaux[noeud]
+            nouveau.nombres[v] = self.nombres[noeud]
+            nouveau.lmin[v] = self.lmin[noeud]
+            nouveau.lmax[v] = self.lmax[noeud]
+            arcs = []
+            e = premiers[noeud]
+            while e >= 0:
+                enfant = canoniques[cibles[e]]
+                w = numeros.get(enfant)
+                if w is None:
+                    w = nouveau._nouveau_noeud()
+                    numeros[enfant] = w
+                    ordre.append(enfant)
+                arcs.append((codes[e], w))
+                e = suivants[e]
+            suivant = -1
+            for code, w in reversed(arcs):
+                suivant = nouveau._nouvel_arc(code, w, suivant)
+            nouveau.premiers[v] = suivant
+
+        for attribut in ("finaux", "nombres", "lmin", "lmax", "premiers", "codes", "cibles", "suivants"):
+            setattr(self, attribut, getattr(nouveau, attribut))
+        self.racine = nouveau.racine
+        self._noeuds_libres = []
+        self._arcs_libres = []
+        self.compacte = True
+        return self
+
+    def nombre_noeuds(self) -> int:
+        """Nombre de nœuds distincts (partagés comptés une fois)."""
+        return len(self._noeuds_accessibles())
+
+    def union(self, autre: 'Trie') -> 'Trie':
+        return _combiner(self, autre, "union")
+
+    def intersection(self, autre: 'Trie') -> 'Trie':
+        return _combiner(self, autre, "intersection")
+
+    def difference(self, autre: 'Trie') -> 'Trie':
+        return _combiner(self, autre, "difference")
+
+    def __repr__(self) -> str:
+        nature = "DAWG" if self.compacte else "Trie"
+        return f"{nature}({len(self)} mots, {self.nombre_noeuds()} nœuds)"
+
+
+def _combiner(a: Trie, b: Trie, operation: str) -> Trie:
+    """
+    Parcours simultané de deux tries (version itérative) pour 'union',
+    'intersection' ou 'difference' ; le résultat est un trie neuf, dont
+    les nœuds sont créés de bas en haut (seuls les sous-arbres non vides).
+    """
+    def symboles(x: Optional[int], y: Optional[int]) -> Iterator[str]:
+        if operation == "intersection":
+            return iter([s for s, _ in a.enfants(x) if b.enfant(y, s) is not None])
+        if operation == "difference" or y is None:
+            return iter([s for s, _ in a.enfants(x)])
+        if x is None:
+            return iter([s for s, _ in b.enfants(y)])
+        return iter(sorted({s for s, _ in a.enfants(x)} | {s for s, _ in b.enfants(y)}))
+
+    def vide(x: Optional[int], y: Optional[int]) -> bool:
+        if operation == "intersection":
+            return x is None or y is None
+        if operation == "difference":
+            return x is None
+        return x is None and y is None
+
+    resultat = Trie()
+    if vide(a.racine, b.racine):
+        return resultat
+    # Cadre : [x, y, symboles restants, arcs du résultat (symbole, nœud), symbole dans le parent]
+    pile = [[a.racine, b.racine, symboles(a.racine, b.racine), [], None]]
+    while pile:
+        cadre = pile[-1]
+        x, y, restants, arcs = cadre[0], cadre[1], cadre[2], cadre[3]
+        symbole = next(restants, None)
+        if symbole is not None:
+            cx = a.enfant(x, symbole) if x is not None else None
+            cy = b.enfant(y, symbole) if y is not None else None
+            if not vide(cx, cy):
+                pile.append([cx, cy, symboles(cx, cy), [], symbole])
+            continue
+
+        pile.pop()
+        fx = x is not None and a.est_final(x)
+        fy = y is not None and b.est_final(y)
+        if operation == "union":
+            final = fx or fy
+        elif operation == "intersection":
+            final = fx and fy
+        else:
+            final = fx and not fy
+        if not (final or arcs):
+            continue
+        noeud = resultat._nouveau_noeud() if pile else resultat.racine
+        resultat.finaux[noeud] = 1 if final else 0
+        suivant = -1
+        for s, enfant in reversed(arcs):
+            suivant = resultat._nouvel_arc(resultat._code(s), enfant, suivant)
+        resultat.premiers[noeud] = suivant
+        resultat._mettre_a_jour(noeud)
+        if pile:
+            pile[-1][3].append((cadre[4], noeud))
+    return resultat